@@ -281,7 +281,8 @@ else
 fi
 echo ""
 
-# Execute installation via pip
+# Execute installation via pip. Byte-compile the installed sources so that the first
+# 'import vimba' does not have to compile them, even if compilation is disabled in pip's config.
 if [ -z $TARGET ]
 then
     TARGET="$SOURCEDIR"
@@ -289,7 +290,7 @@ else
     TARGET="$SOURCEDIR[$TARGET]"
 fi
 
-$PYTHON -m pip install "$TARGET"
+$PYTHON -m pip install --compile "$TARGET"
 
 if [ $? -eq 0 ]
 then
@@ -28,6 +28,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import unittest
 import ctypes
 
+from ctypes import byref, sizeof
 from vimba.c_binding import *
 
 
@@ -51,6 +52,11 @@ class VimbaCommonTest(unittest.TestCase):
         actual = decode_cstr(ctypes.c_char_p(b'test').value)
         self.assertEqual(expected, actual)
 
+        # Strings reported by VimbaC are UTF-8 encoded, e.g. units like 'µs'.
+        expected = 'µs'
+        actual = decode_cstr(ctypes.c_char_p('µs'.encode('utf-8')).value)
+        self.assertEqual(expected, actual)
+
     def test_decode_flags_zero(self):
         # Expected Behavior: In case no bytes are set the
         #    zero value of the Flag Enum must be returned
@@ -81,6 +87,41 @@ class VimbaCommonTest(unittest.TestCase):
         # decoded correctly.
         self.assertEqual(list(expected).sort(), list(actual).sort())
 
+    def test_decode_flags_cached(self):
+        # Expected Behavior: Decoding the same mask twice returns the identical tuple. Bits
+        # outside of the 32 bit flag range are ignored.
+        mask = int(VmbFeatureFlags.Read) | int(VmbFeatureFlags.Write)
+
+        self.assertIs(decode_flags(VmbFeatureFlags, mask), decode_flags(VmbFeatureFlags, mask))
+        self.assertEqual(decode_flags(VmbFeatureFlags, (1 << 32) | mask),
+                         (VmbFeatureFlags.Read, VmbFeatureFlags.Write))
+
+    def test_lazy_exports_complete(self):
+        # Expected Behavior: Every name in __all__ of both packages has an entry in the lazy
+        # export table pointing to a submodule that actually provides it.
+        import importlib
+        import vimba
+        import vimba.c_binding
+
+        for package in (vimba, vimba.c_binding):
+            for name in package.__all__:
+                module_name = package._LAZY_EXPORTS[name]
+                module = importlib.import_module(module_name, package.__name__)
+                self.assertTrue(hasattr(module, name), name)
+
+    def test_lazy_exports_survive_reload(self):
+        # Expected Behavior: Reloading a package keeps the already resolved exports. Enum types
+        # are not rebuilt and keep their identity.
+        import importlib
+        import vimba.c_binding
+
+        expected = (vimba.c_binding.VmbError, vimba.c_binding.VmbPixelFormat)
+        importlib.reload(vimba.c_binding)
+
+        self.assertIs(expected[0], vimba.c_binding.VmbError)
+        self.assertIs(expected[1], vimba.c_binding.VmbPixelFormat)
+        self.assertIs(VmbError, vimba.c_binding.VmbError)
+
 
 class CBindingVimbaCTypesTest(unittest.TestCase):
     def setUp(self):
@@ -235,6 +276,43 @@ class CBindingVimbaCTypesTest(unittest.TestCase):
         self.assertEqual(VmbFrameFlags.FrameID, 4)
         self.assertEqual(VmbFrameFlags.Timestamp, 8)
 
+    def test_enum_str_is_member_name(self):
+        # Expectation: str() of C-Layer enums is the plain member name while repr() keeps the
+        # default enum representation.
+        self.assertEqual(str(VmbError.BadParameter), 'BadParameter')
+        self.assertEqual(str(VmbPixelFormat.Mono8), 'Mono8')
+        self.assertEqual(str(VmbFrameStatus.Incomplete), 'Incomplete')
+        self.assertEqual(repr(VmbError.IO), '<VmbError.IO: -20>')
+
+    def test_vmb_frame_deepcopy_skip_ptr(self):
+        # Expectation: All scalar fields are copied while buffer, bufferSize and context
+        # of the copy stay cleared.
+        buf = (ctypes.c_ubyte * 8)()
+        frame = VmbFrame(buffer=ctypes.addressof(buf), bufferSize=8, context=(1, 2, 3, 4),
+                         receiveStatus=VmbFrameStatus.Incomplete, receiveFlags=15, imageSize=6,
+                         ancillarySize=2, pixelFormat=VmbPixelFormat.Mono8, width=3, height=2,
+                         offsetX=1, offsetY=4, frameID=2 ** 40, timestamp=2 ** 63 + 5)
+
+        memo = {}
+        cpy = frame.deepcopy_skip_ptr(memo)
+
+        self.assertIs(memo[id(frame)], cpy)
+        self.assertIsNone(cpy.buffer)
+        self.assertEqual(cpy.bufferSize, 0)
+        self.assertEqual(list(cpy.context), [None, None, None, None])
+
+        for name, _ in VmbFrame._fields_[3:]:
+            self.assertEqual(getattr(cpy, name), getattr(frame, name), name)
+
+    def test_struct_fields_naturally_aligned(self):
+        # Expectation: Structures shared with VimbaC use the native C layout. Every field
+        # must start at an offset matching the alignment of its type.
+        for struct in (VmbFrame, VmbFeatureInfo, VmbCameraInfo, VmbInterfaceInfo):
+            for name, field_type in struct._fields_:
+                with self.subTest(f'{struct.__name__}.{name}'):
+                    offset = getattr(struct, name).offset
+                    self.assertEqual(offset % ctypes.alignment(field_type), 0)
+
 
 class VimbaCTest(unittest.TestCase):
     def setUp(self):
@@ -305,6 +383,50 @@ class VimbaCTest(unittest.TestCase):
         except VimbaCError as e:
             self.assertEqual(e.get_error_code(), VmbError.BadParameter)
 
+    def test_call_vimba_c_signatures_attached(self):
+        # Expectation: Signatures of VimbaC functions are attached once on first use.
+        # ctypes must never deduce argument types on a per call basis. Error codes are returned
+        # as plain integers and evaluated by call_vimba_c.
+        from vimba.c_binding import vimba_c
+
+        call_vimba_c('VmbVersionQuery', byref(VmbVersionInfo()), sizeof(VmbVersionInfo))
+        self.assertIn('VmbVersionQuery', vimba_c._FUNCS)
+
+        for func_name, (restype, argtypes) in vimba_c._SIGNATURES.items():
+            # Building a call binds the function without calling into VimbaC.
+            build_vimba_c_call(func_name)
+            fn = vimba_c._FUNCS[func_name]
+
+            self.assertEqual(list(fn.argtypes or ()), list(argtypes or ()))
+            self.assertIs(fn.restype, VmbInt32 if restype is VmbError else restype)
+
+    def test_build_vimba_c_call(self):
+        # Expectation: A built call behaves like call_vimba_c for the given function.
+        # Invalid function names raise an AttributeError while building.
+        self.assertRaises(AttributeError, build_vimba_c_call, 'VmbVersionQuer')
+
+        version_query = build_vimba_c_call('VmbVersionQuery')
+        ver_info = VmbVersionInfo()
+
+        self.assertNoRaise(version_query, byref(ver_info), sizeof(ver_info))
+        self.assertGreaterEqual((ver_info.major, ver_info.minor, ver_info.patch), (1, 9, 0))
+
+        try:
+            version_query(byref(ver_info), sizeof(ver_info) - 1)
+            self.fail("Previous call must raise Exception.")
+
+        except VimbaCError as e:
+            self.assertEqual(e.get_error_code(), VmbError.StructSize)
+
+    def test_build_callback_type_reused(self):
+        # Expectation: Callback prototypes are built once per signature. Equal signatures
+        # share the same ctypes type, different signatures lead to different types.
+        frame_cb = build_callback_type(None, VmbHandle, ctypes.POINTER(VmbFrame))
+        feat_cb = build_callback_type(None, VmbHandle, ctypes.c_char_p, ctypes.c_void_p)
+
+        self.assertIs(frame_cb, build_callback_type(None, VmbHandle, ctypes.POINTER(VmbFrame)))
+        self.assertIsNot(frame_cb, feat_cb)
+
 
 class ImageTransformTest(unittest.TestCase):
     def setUp(self):
@@ -344,3 +466,15 @@ class ImageTransformTest(unittest.TestCase):
     def test_call_vimba_c_exception(self):
         # Expectation: Failed operations must raise a VimbaCError
         self.assertRaises(VimbaCError, call_vimba_image_transform, 'VmbGetVersion', None)
+
+    def test_layout_to_pixel_format_uses_all_bits(self):
+        # Expectation: Layouts shared by several formats map to the format using all bits
+        for fmt, expected in ((VmbPixelFormat.Mono8, VmbPixelFormat.Mono8),
+                              (VmbPixelFormat.Mono10, VmbPixelFormat.Mono16),
+                              (VmbPixelFormat.BayerGR12, VmbPixelFormat.BayerBG16),
+                              (VmbPixelFormat.Bgra14, VmbPixelFormat.Bgra16)):
+            layout = PIXEL_FORMAT_TO_LAYOUT[fmt]
+            self.assertEqual(LAYOUT_TO_PIXEL_FORMAT[layout], expected)
+
+        for layout in PIXEL_FORMAT_TO_LAYOUT.values():
+            self.assertEqual(PIXEL_FORMAT_TO_LAYOUT[LAYOUT_TO_PIXEL_FORMAT[layout]], layout)
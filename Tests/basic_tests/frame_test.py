@@ -0,0 +1,99 @@
+"""BSD 2-Clause License
+
+Copyright (c) 2019, Allied Vision Technologies GmbH
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import unittest
+import ctypes
+
+from vimba import *
+from vimba.frame import *
+
+
+class FrameTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy  # noqa: F401
+
+        except ImportError:
+            self.skipTest('numpy is not installed')
+
+    def tearDown(self):
+        pass
+
+    def _create_frame(self, fmt: PixelFormat, width: int, height: int, channels: int) -> Frame:
+        frame = Frame(width * height * channels, AllocationMode.AnnounceFrame)
+        frame._frame.pixelFormat = fmt
+        frame._frame.width = width
+        frame._frame.height = height
+        frame._frame.imageSize = width * height * channels
+
+        for i in range(frame._frame.imageSize):
+            frame._buffer[i] = i % 256
+
+        return frame
+
+    def test_numpy_ndarray_no_copy(self):
+        # Expectation: as_numpy_ndarray() must construct a view on the frame buffer instead of
+        # copying the image data. No camera is required to verify this.
+        frame = self._create_frame(PixelFormat.Bgr8, 4, 2, 3)
+        arr = frame.as_numpy_ndarray()
+
+        self.assertEqual(arr.shape, (2, 4, 3))
+        self.assertEqual(arr.__array_interface__['data'][0], ctypes.addressof(frame.get_buffer()))
+
+        arr[0, 0, 0] = 42
+        self.assertEqual(frame.get_buffer()[0], 42)
+
+    def test_numpy_ndarray_view_reused(self):
+        # Expectation: Repeated calls return the same view until format, size or buffer change
+        frame = self._create_frame(PixelFormat.Bgr8, 4, 2, 3)
+        arr = frame.as_numpy_ndarray()
+
+        self.assertIs(arr, frame.as_numpy_ndarray())
+
+        frame._frame.height = 1
+        self.assertEqual(frame.as_numpy_ndarray().shape, (1, 4, 3))
+
+        frame._frame.height = 2
+        frame.convert_pixel_format(PixelFormat.Rgb8)
+        self.assertIsNot(arr, frame.as_numpy_ndarray())
+        self.assertEqual(frame.as_numpy_ndarray().__array_interface__['data'][0],
+                         ctypes.addressof(frame.get_buffer()))
+
+    def test_convert_swaps_channels(self):
+        # Expectation: Converting between RGB and BGR orders must only swap red and blue, alpha
+        # and green values must be kept.
+        for src_fmt, dst_fmt, channels in ((PixelFormat.Rgb8, PixelFormat.Bgr8, 3),
+                                           (PixelFormat.Bgra8, PixelFormat.Rgba8, 4)):
+            with self.subTest('{} -> {}'.format(src_fmt, dst_fmt)):
+                frame = self._create_frame(src_fmt, 4, 2, channels)
+                expected = frame.as_numpy_ndarray().copy()
+                expected[..., [0, 2]] = expected[..., [2, 0]]
+
+                frame.convert_pixel_format(dst_fmt)
+
+                self.assertEqual(frame.get_pixel_format(), dst_fmt)
+                self.assertTrue((frame.as_numpy_ndarray() == expected).all())
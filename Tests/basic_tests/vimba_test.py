@@ -25,7 +25,11 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+import os
+import subprocess
+import sys
 import unittest
+
 from vimba import *
 
 
@@ -40,6 +44,16 @@ class VimbaTest(unittest.TestCase):
         # Expected behavior: Multiple calls to Vimba.get_instance() return the same object.
         self.assertEqual(self.vimba, Vimba.get_instance())
 
+    def test_submodule_access_after_import(self):
+        # Expected behavior: Submodules are accessible as attributes after a plain 'import vimba'.
+        # Executed in a fresh interpreter, the submodules are already imported by the test suite.
+        code = 'import vimba; vimba.frame.PixelFormat; vimba.c_binding.vimba_c.VmbFrame'
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, '-c', code], env=env, stderr=subprocess.PIPE,
+                                universal_newlines=True)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+
     def test_get_version(self):
         # Expectation: Returned Version is not empty and does not raise any exceptions.
         self.assertNotEqual(self.vimba.get_version(), "")
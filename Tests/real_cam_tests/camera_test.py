@@ -29,6 +29,7 @@ import unittest
 import threading
 import os
 
+import vimba.camera
 from vimba import *
 from vimba.frame import *
 
@@ -181,6 +182,29 @@ class CamCameraTest(unittest.TestCase):
             self.assertNoRaise(self.cam.get_frame)
             self.assertEqual(type(self.cam.get_frame()), Frame)
 
+    def test_camera_get_frame_leaves_capturing_mode(self):
+        # Expectation: get_frame tears down the capture state machine before returning.
+        # Frame buffers must not stay announced until the generator is garbage collected.
+        fsms = []
+
+        class RecordingFsm(vimba.camera._CaptureFsm):
+            def __init__(self, context):
+                super().__init__(context)
+                fsms.append(self)
+
+        orig_fsm = vimba.camera._CaptureFsm
+        vimba.camera._CaptureFsm = RecordingFsm
+
+        try:
+            with self.cam:
+                self.cam.get_frame()
+
+        finally:
+            vimba.camera._CaptureFsm = orig_fsm
+
+        self.assertEqual(len(fsms), 1)
+        self.assertIsInstance(fsms[0]._CaptureFsm__state, vimba.camera._StateInit)
+
     def test_camera_capture_error_outside_vimba_scope(self):
         # Expectation: Camera access outside of Vimba scope must lead to a RuntimeError
         gener = None
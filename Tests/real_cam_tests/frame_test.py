@@ -31,6 +31,7 @@ import ctypes
 
 from vimba import *
 from vimba.frame import *
+from vimba.c_binding import PIXEL_FORMAT_TO_LAYOUT
 
 
 class CamFrameTest(unittest.TestCase):
@@ -158,6 +159,26 @@ class CamFrameTest(unittest.TestCase):
 
                 self.assertEquals(frame._frame.bufferSize, frame_cpy._frame.bufferSize)
 
+    def test_numpy_ndarray_no_copy(self):
+        # Expectation: as_numpy_ndarray() must construct a view on the frame buffer instead of
+        # copying the image data.
+        try:
+            import numpy  # noqa: F401
+
+        except ImportError:
+            self.skipTest('numpy is not installed')
+
+        for allocation_mode in AllocationMode:
+            with self.subTest(f'allocation_mode={str(allocation_mode)}'):
+                with self.cam:
+                    frame = self.cam.get_frame(allocation_mode=allocation_mode)
+
+                if frame.get_pixel_format() not in PIXEL_FORMAT_TO_LAYOUT:
+                    frame.convert_pixel_format(PixelFormat.Mono8)
+
+                data_address = frame.as_numpy_ndarray().__array_interface__['data'][0]
+                self.assertEqual(data_address, ctypes.addressof(frame.get_buffer()))
+
     def test_get_pixel_format(self):
         # Expectation: Frames have an image format set after acquisition
         for allocation_mode in AllocationMode:
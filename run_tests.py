@@ -26,8 +26,10 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import os
+import re
 import shutil
 import subprocess
+import sys
 import docopt
 
 
@@ -43,7 +45,73 @@ def stringify_list(l):
     return list_str
 
 
-def static_test():
+def pointer_usage_test():
+    # ctypes.pointer() allocates a pointer object for each call. Arguments passed by reference
+    # must use ctypes.byref() instead.
+    fprint('Execute Static Test: ctypes.pointer usage')
+    pattern = re.compile(r'\bpointer\(')
+    findings = []
+
+    for root, _, files in os.walk('vimba'):
+        for file in [f for f in files if f.endswith('.py')]:
+            path = os.path.join(root, file)
+
+            with open(path, 'r') as f:
+                for line_no, line in enumerate(f, 1):
+                    if pattern.search(line):
+                        findings.append('{}:{}: {}'.format(path, line_no, line.strip()))
+
+    for finding in findings:
+        fprint(finding)
+
+    if findings:
+        raise RuntimeError('ctypes.pointer() used. Use ctypes.byref() instead.')
+
+    fprint('')
+
+
+def import_time_test(max_time_ms=None, top=10):
+    # Importing the package and its entry point must stay cheap. Measure it with
+    # '-X importtime' and print the most expensive modules. The measurement depends on the
+    # machine, a budget is only enforced if one is given.
+    fprint('Execute Static Test: import time')
+    code = 'import sys; sys.stderr.write("--\\n"); from vimba import Vimba'
+    cmd = [sys.executable, '-X', 'importtime', '-c', code]
+    result = subprocess.run(cmd, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+    pattern = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+    timings = []
+    total_us = 0
+
+    # Everything imported after the marker was imported on behalf of the package. Modules
+    # loaded lazily on attribute access show up as further top level entries.
+    lines = result.stderr.splitlines()
+    for line in lines[lines.index('--') + 1:]:
+        match = pattern.match(line)
+        if not match:
+            continue
+
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append((int(self_us), int(cumulative_us), module))
+
+        if not indent:
+            total_us += int(cumulative_us)
+
+    for self_us, cumulative_us, module in sorted(timings, reverse=True)[:top]:
+        fprint('{:>10} us {:>10} us  {}'.format(self_us, cumulative_us, module))
+
+    fprint('from vimba import Vimba: {:.1f} ms'.format(total_us / 1000))
+
+    if (max_time_ms is not None) and (total_us > max_time_ms * 1000):
+        raise RuntimeError('from vimba import Vimba took longer than {} ms.'.format(max_time_ms))
+
+    fprint('')
+
+
+def static_test(max_import_ms):
+    pointer_usage_test()
+    import_time_test(max_import_ms)
+
     fprint('Execute Static Test: flake8')
     subprocess.run('flake8 vimba', shell=True)
     subprocess.run('flake8 Examples --ignore=F405,F403', shell=True)
@@ -85,7 +153,10 @@ def setup_junit(report_dir):
     os.mkdir(report_dir)
 
 
-def static_test_junit(report_dir):
+def static_test_junit(report_dir, max_import_ms):
+    pointer_usage_test()
+    import_time_test(max_import_ms)
+
     fprint('Execute Static Test: flake8')
     cmd = 'flake8 vimba --output-file=' + report_dir + '/flake8.txt'
     subprocess.run(cmd, shell=True, check=True)
@@ -125,14 +196,14 @@ def unit_test_junit(report_dir, testsuite, testcamera, blacklist):
         os.remove(coverage_file)
 
 
-def test(testsuite, testcamera, blacklist):
-    static_test()
+def test(testsuite, testcamera, blacklist, max_import_ms):
+    static_test(max_import_ms)
     unit_test(testsuite, testcamera, blacklist)
 
 
-def test_junit(report_dir, testsuite, testcamera, blacklist):
+def test_junit(report_dir, testsuite, testcamera, blacklist, max_import_ms):
     setup_junit(report_dir)
-    static_test_junit(report_dir)
+    static_test_junit(report_dir, max_import_ms)
     unit_test_junit(report_dir, testsuite, testcamera, blacklist)
 
 
@@ -140,32 +211,36 @@ def main():
     CLI = """VimbaPython tests script.
     Usage:
         run_tests.py -h
-        run_tests.py test -s basic [BLACKLIST...]
-        run_tests.py test -s (real_cam | all) -c CAMERA_ID [BLACKLIST...]
-        run_tests.py test_junit -s basic [BLACKLIST...]
-        run_tests.py test_junit -s (real_cam | all) -c CAMERA_ID [BLACKLIST...]
+        run_tests.py test -s basic [-t MS] [BLACKLIST...]
+        run_tests.py test -s (real_cam | all) -c CAMERA_ID [-t MS] [BLACKLIST...]
+        run_tests.py test_junit -s basic [-t MS] [BLACKLIST...]
+        run_tests.py test_junit -s (real_cam | all) -c CAMERA_ID [-t MS] [BLACKLIST...]
 
     Arguments:
         CAMERA_ID    Camera Id from Camera that shall be used during testing
         BLACKLIST    Optional sequence of unittest functions to skip.
+        MS           Import time budget in milliseconds.
 
     Options:
         -h   Show this screen.
         -s   Unittestsuite. Can be 'basic', 'real_cam' or 'all'. The last two require a
              Camera Id to test against.
         -c   Camera Id used in testing.
+        -t   Fail if 'from vimba import Vimba' takes longer than the given budget.
+             Without it, the import time is only reported.
     """
 
     args = docopt.docopt(CLI)
 
     suite = 'basic' if args['basic'] else 'real_cam' if args['real_cam'] else 'all'
+    max_import_ms = float(args['MS']) if args['MS'] else None
 
     if args['test']:
-        test(suite, args['CAMERA_ID'], args['BLACKLIST'])
+        test(suite, args['CAMERA_ID'], args['BLACKLIST'], max_import_ms)
 
     elif args['test_junit']:
         report_dir = 'Test_Reports'
-        test_junit(report_dir, suite, args['CAMERA_ID'], args['BLACKLIST'])
+        test_junit(report_dir, suite, args['CAMERA_ID'], args['BLACKLIST'], max_import_ms)
 
 
 if __name__ == '__main__':
@@ -28,9 +28,12 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # Suppress 'imported but unused' - Error from static style checker.
 # flake8: noqa: F401
 
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING
+
 __version__ = '1.2.1'
 
-__all__ = [
+__all__ = (
     'Vimba',
     'Camera',
     'CameraChangeHandler',
@@ -98,31 +101,143 @@ __all__ = [
     'TraceEnable',
     'ScopedLogEnable',
     'RuntimeTypeCheckEnable'
-]
-
-# Import everything exported from the top level module
-from .vimba import Vimba
-
-from .camera import AccessMode, PersistType, Camera, CameraChangeHandler, CameraEvent, FrameHandler
-
-from .interface import Interface, InterfaceType, InterfaceChangeHandler, InterfaceEvent
-
-from .frame import PixelFormat, Frame, Debayer, intersect_pixel_formats, MONO_PIXEL_FORMATS, \
-                   BAYER_PIXEL_FORMATS, RGB_PIXEL_FORMATS, RGBA_PIXEL_FORMATS, BGR_PIXEL_FORMATS, \
-                   BGRA_PIXEL_FORMATS, YUV_PIXEL_FORMATS, YCBCR_PIXEL_FORMATS, \
-                   COLOR_PIXEL_FORMATS, OPENCV_PIXEL_FORMATS, FrameStatus, FeatureTypes, \
-                   AllocationMode
-
-from .error import VimbaSystemError, VimbaCameraError, VimbaInterfaceError, VimbaFeatureError, \
-                   VimbaFrameError, VimbaTimeout
-
-from .feature import IntFeature, FloatFeature, StringFeature, BoolFeature, EnumEntry, EnumFeature, \
-                     CommandFeature, RawFeature
-
-from .util import Log, LogLevel, LogConfig, LOG_CONFIG_TRACE_CONSOLE_ONLY, \
-                  LOG_CONFIG_TRACE_FILE_ONLY, LOG_CONFIG_TRACE, LOG_CONFIG_INFO_CONSOLE_ONLY, \
-                  LOG_CONFIG_INFO_FILE_ONLY, LOG_CONFIG_INFO, LOG_CONFIG_WARNING_CONSOLE_ONLY, \
-                  LOG_CONFIG_WARNING_FILE_ONLY, LOG_CONFIG_WARNING, LOG_CONFIG_ERROR_CONSOLE_ONLY, \
-                  LOG_CONFIG_ERROR_FILE_ONLY, LOG_CONFIG_ERROR, LOG_CONFIG_CRITICAL_CONSOLE_ONLY, \
-                  LOG_CONFIG_CRITICAL_FILE_ONLY, LOG_CONFIG_CRITICAL, ScopedLogEnable, \
-                  TraceEnable, RuntimeTypeCheckEnable
+)
+
+# Static type checkers don't evaluate the module level __getattr__. Import the exports for them
+# as the runtime does on first access.
+if TYPE_CHECKING:
+    from .vimba import Vimba
+
+    from .camera import AccessMode, PersistType, Camera, CameraChangeHandler, CameraEvent, \
+                        FrameHandler
+
+    from .interface import Interface, InterfaceType, InterfaceChangeHandler, InterfaceEvent
+
+    from .frame import PixelFormat, Frame, Debayer, intersect_pixel_formats, MONO_PIXEL_FORMATS, \
+                       BAYER_PIXEL_FORMATS, RGB_PIXEL_FORMATS, RGBA_PIXEL_FORMATS, \
+                       BGR_PIXEL_FORMATS, BGRA_PIXEL_FORMATS, YUV_PIXEL_FORMATS, \
+                       YCBCR_PIXEL_FORMATS, COLOR_PIXEL_FORMATS, OPENCV_PIXEL_FORMATS, FrameStatus, \
+                       FeatureTypes, AllocationMode
+
+    from .error import VimbaSystemError, VimbaCameraError, VimbaInterfaceError, \
+                       VimbaFeatureError, VimbaFrameError, VimbaTimeout
+
+    from .feature import IntFeature, FloatFeature, StringFeature, BoolFeature, EnumEntry, \
+                         EnumFeature, CommandFeature, RawFeature
+
+    from .util import Log, LogLevel, LogConfig, LOG_CONFIG_TRACE_CONSOLE_ONLY, \
+                      LOG_CONFIG_TRACE_FILE_ONLY, LOG_CONFIG_TRACE, LOG_CONFIG_INFO_CONSOLE_ONLY, \
+                      LOG_CONFIG_INFO_FILE_ONLY, LOG_CONFIG_INFO, LOG_CONFIG_WARNING_CONSOLE_ONLY, \
+                      LOG_CONFIG_WARNING_FILE_ONLY, LOG_CONFIG_WARNING, \
+                      LOG_CONFIG_ERROR_CONSOLE_ONLY, LOG_CONFIG_ERROR_FILE_ONLY, LOG_CONFIG_ERROR, \
+                      LOG_CONFIG_CRITICAL_CONSOLE_ONLY, LOG_CONFIG_CRITICAL_FILE_ONLY, \
+                      LOG_CONFIG_CRITICAL, ScopedLogEnable, TraceEnable, RuntimeTypeCheckEnable
+
+# Exports are imported on first access and cached within the module namespace. Importing the
+# package itself does not load VimbaC, e.g. to query __version__.
+_LAZY_EXPORTS = {
+    'Vimba': '.vimba',
+    'Camera': '.camera',
+    'CameraChangeHandler': '.camera',
+    'CameraEvent': '.camera',
+    'AccessMode': '.camera',
+    'PersistType': '.camera',
+    'Interface': '.interface',
+    'InterfaceType': '.interface',
+    'InterfaceChangeHandler': '.interface',
+    'InterfaceEvent': '.interface',
+    'PixelFormat': '.frame',
+    'Frame': '.frame',
+    'FeatureTypes': '.frame',
+    'FrameHandler': '.camera',
+    'FrameStatus': '.frame',
+    'AllocationMode': '.frame',
+    'Debayer': '.frame',
+    'intersect_pixel_formats': '.frame',
+    'MONO_PIXEL_FORMATS': '.frame',
+    'BAYER_PIXEL_FORMATS': '.frame',
+    'RGB_PIXEL_FORMATS': '.frame',
+    'RGBA_PIXEL_FORMATS': '.frame',
+    'BGR_PIXEL_FORMATS': '.frame',
+    'BGRA_PIXEL_FORMATS': '.frame',
+    'YUV_PIXEL_FORMATS': '.frame',
+    'YCBCR_PIXEL_FORMATS': '.frame',
+    'COLOR_PIXEL_FORMATS': '.frame',
+    'OPENCV_PIXEL_FORMATS': '.frame',
+
+    'VimbaSystemError': '.error',
+    'VimbaCameraError': '.error',
+    'VimbaInterfaceError': '.error',
+    'VimbaFeatureError': '.error',
+    'VimbaFrameError': '.error',
+    'VimbaTimeout': '.error',
+
+    'IntFeature': '.feature',
+    'FloatFeature': '.feature',
+    'StringFeature': '.feature',
+    'BoolFeature': '.feature',
+    'EnumEntry': '.feature',
+    'EnumFeature': '.feature',
+    'CommandFeature': '.feature',
+    'RawFeature': '.feature',
+
+    'LogLevel': '.util',
+    'LogConfig': '.util',
+    'Log': '.util',
+    'LOG_CONFIG_TRACE_CONSOLE_ONLY': '.util',
+    'LOG_CONFIG_TRACE_FILE_ONLY': '.util',
+    'LOG_CONFIG_TRACE': '.util',
+    'LOG_CONFIG_INFO_CONSOLE_ONLY': '.util',
+    'LOG_CONFIG_INFO_FILE_ONLY': '.util',
+    'LOG_CONFIG_INFO': '.util',
+    'LOG_CONFIG_WARNING_CONSOLE_ONLY': '.util',
+    'LOG_CONFIG_WARNING_FILE_ONLY': '.util',
+    'LOG_CONFIG_WARNING': '.util',
+    'LOG_CONFIG_ERROR_CONSOLE_ONLY': '.util',
+    'LOG_CONFIG_ERROR_FILE_ONLY': '.util',
+    'LOG_CONFIG_ERROR': '.util',
+    'LOG_CONFIG_CRITICAL_CONSOLE_ONLY': '.util',
+    'LOG_CONFIG_CRITICAL_FILE_ONLY': '.util',
+    'LOG_CONFIG_CRITICAL': '.util',
+
+    'TraceEnable': '.util',
+    'ScopedLogEnable': '.util',
+    'RuntimeTypeCheckEnable': '.util'
+}
+
+
+def _build_lazy_loader(namespace: dict, lazy_exports: dict, submodules: tuple):
+    """Build module level __getattr__ and __dir__ functions for a package namespace.
+
+    Names found in 'lazy_exports' are imported from the mapped submodule on first access and
+    cached in 'namespace'. Names in 'submodules' are imported as submodule of the package, as
+    if the package had imported them eagerly. The loader is shared with the c_binding subpackage.
+    """
+    package = namespace['__name__']
+
+    def __getattr__(name: str):
+        try:
+            module_name = lazy_exports[name]
+
+        except KeyError:
+            if name in submodules:
+                # Importing a submodule binds it within the package namespace.
+                return _import_module('.' + name, package)
+
+            raise AttributeError('module {} has no attribute {}'.format(package, name)) from None
+
+        value = getattr(_import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace).union(namespace['__all__']))
+
+    return __getattr__, __dir__
+
+
+# Submodules were bound by the eager imports of earlier versions, e.g. 'vimba.frame'.
+_SUBMODULES = ('c_binding', 'camera', 'error', 'feature', 'frame', 'interface', 'shared', 'util',
+               'vimba')
+
+__getattr__, __dir__ = _build_lazy_loader(globals(), _LAZY_EXPORTS, _SUBMODULES)
@@ -39,7 +39,11 @@ of the public API have no prefix.
 # Suppress 'imported but unused' - Error from static style checker.
 # flake8: noqa: F401
 
-__all__ = [
+from typing import TYPE_CHECKING
+
+from .. import _build_lazy_loader
+
+__all__ = (
     # Exports from vimba_common
     'VmbInt8',
     'VmbUint8',
@@ -76,9 +80,12 @@ __all__ = [
     'VmbFrame',
     'VmbFeaturePersistSettings',
     'G_VIMBA_C_HANDLE',
-    'VIMBA_C_VERSION',
+    'SIZEOF_VMB_FRAME',
+    'SIZEOF_VMB_FEATURE_INFO',
+    'SIZEOF_VMB_FEATURE_ENUM_ENTRY',
     'EXPECTED_VIMBA_C_VERSION',
     'call_vimba_c',
+    'build_vimba_c_call',
     'build_callback_type',
 
     # Exports from vimba_image_transform
@@ -86,35 +93,106 @@ __all__ = [
     'VmbImageInfo',
     'VmbDebayerMode',
     'VmbTransformInfo',
-    'VIMBA_IMAGE_TRANSFORM_VERSION',
     'EXPECTED_VIMBA_IMAGE_TRANSFORM_VERSION',
     'call_vimba_image_transform',
     'PIXEL_FORMAT_TO_LAYOUT',
     'LAYOUT_TO_PIXEL_FORMAT',
-    'PIXEL_FORMAT_CONVERTIBILITY_MAP',
-
-    # Exports from ctypes
-    'byref',
-    'sizeof',
-    'create_string_buffer'
-]
-
-from .vimba_common import VmbInt8, VmbUint8, VmbInt16, VmbUint16, VmbInt32, VmbUint32, \
-                          VmbInt64, VmbUint64, VmbHandle, VmbBool, VmbUchar, VmbDouble, VmbError, \
-                          VimbaCError, VmbPixelFormat, decode_cstr, decode_flags, \
-                          _select_vimba_home
-
-from .vimba_c import VmbInterface, VmbAccessMode, VmbFeatureData, \
-                   VmbFeaturePersist, VmbFeatureVisibility, VmbFeatureFlags, VmbFrameStatus, \
-                   VmbFrameFlags, VmbVersionInfo, VmbInterfaceInfo, VmbCameraInfo, VmbFeatureInfo, \
-                   VmbFeatureEnumEntry, VmbFrame, VmbFeaturePersistSettings, \
-                   G_VIMBA_C_HANDLE, EXPECTED_VIMBA_C_VERSION, VIMBA_C_VERSION, call_vimba_c, \
-                   build_callback_type
-
-from .vimba_image_transform import VmbImage, VmbImageInfo, VmbDebayerMode, \
-                                   VIMBA_IMAGE_TRANSFORM_VERSION, \
-                                   EXPECTED_VIMBA_IMAGE_TRANSFORM_VERSION, VmbTransformInfo, \
-                                   call_vimba_image_transform, PIXEL_FORMAT_TO_LAYOUT, \
-                                   LAYOUT_TO_PIXEL_FORMAT, PIXEL_FORMAT_CONVERTIBILITY_MAP
-
-from ctypes import byref, sizeof, create_string_buffer
+    'PIXEL_FORMAT_TO_CHANNELS',
+    'query_convertible_formats'
+)
+
+# Static type checkers don't evaluate the module level __getattr__. Import the exports for them
+# as the runtime does on first access.
+if TYPE_CHECKING:
+    from .vimba_common import VmbInt8, VmbUint8, VmbInt16, VmbUint16, VmbInt32, VmbUint32, \
+                              VmbInt64, VmbUint64, VmbHandle, VmbBool, VmbUchar, VmbDouble, \
+                              VmbError, VimbaCError, VmbPixelFormat, decode_cstr, decode_flags, \
+                              _select_vimba_home
+
+    from .vimba_c import VmbInterface, VmbAccessMode, VmbFeatureData, VmbFeaturePersist, \
+                         VmbFeatureVisibility, VmbFeatureFlags, VmbFrameStatus, VmbFrameFlags, \
+                         VmbVersionInfo, VmbInterfaceInfo, VmbCameraInfo, VmbFeatureInfo, \
+                         VmbFeatureEnumEntry, VmbFrame, VmbFeaturePersistSettings, \
+                         G_VIMBA_C_HANDLE, SIZEOF_VMB_FRAME, SIZEOF_VMB_FEATURE_INFO, \
+                         SIZEOF_VMB_FEATURE_ENUM_ENTRY, VIMBA_C_VERSION, EXPECTED_VIMBA_C_VERSION, \
+                         call_vimba_c, build_vimba_c_call, build_callback_type
+
+    from .vimba_image_transform import VmbImage, VmbImageInfo, VmbDebayerMode, VmbTransformInfo, \
+                                       VIMBA_IMAGE_TRANSFORM_VERSION, \
+                                       EXPECTED_VIMBA_IMAGE_TRANSFORM_VERSION, \
+                                       call_vimba_image_transform, PIXEL_FORMAT_TO_LAYOUT, \
+                                       LAYOUT_TO_PIXEL_FORMAT, PIXEL_FORMAT_TO_CHANNELS, \
+                                       PIXEL_FORMAT_CONVERTIBILITY_MAP, query_convertible_formats
+
+# Exports are imported on first access and cached within the module namespace.
+_LAZY_EXPORTS = {
+    # Exports from vimba_common
+    'VmbInt8': '.vimba_common',
+    'VmbUint8': '.vimba_common',
+    'VmbInt16': '.vimba_common',
+    'VmbUint16': '.vimba_common',
+    'VmbInt32': '.vimba_common',
+    'VmbUint32': '.vimba_common',
+    'VmbInt64': '.vimba_common',
+    'VmbUint64': '.vimba_common',
+    'VmbHandle': '.vimba_common',
+    'VmbBool': '.vimba_common',
+    'VmbUchar': '.vimba_common',
+    'VmbDouble': '.vimba_common',
+    'VmbError': '.vimba_common',
+    'VimbaCError': '.vimba_common',
+    'VmbPixelFormat': '.vimba_common',
+    'decode_cstr': '.vimba_common',
+    'decode_flags': '.vimba_common',
+
+    # Exports from vimba_c
+    'VmbInterface': '.vimba_c',
+    'VmbAccessMode': '.vimba_c',
+    'VmbFeatureData': '.vimba_c',
+    'VmbFeaturePersist': '.vimba_c',
+    'VmbFeatureVisibility': '.vimba_c',
+    'VmbFeatureFlags': '.vimba_c',
+    'VmbFrameStatus': '.vimba_c',
+    'VmbFrameFlags': '.vimba_c',
+    'VmbVersionInfo': '.vimba_c',
+    'VmbInterfaceInfo': '.vimba_c',
+    'VmbCameraInfo': '.vimba_c',
+    'VmbFeatureInfo': '.vimba_c',
+    'VmbFeatureEnumEntry': '.vimba_c',
+    'VmbFrame': '.vimba_c',
+    'VmbFeaturePersistSettings': '.vimba_c',
+    'G_VIMBA_C_HANDLE': '.vimba_c',
+    'SIZEOF_VMB_FRAME': '.vimba_c',
+    'SIZEOF_VMB_FEATURE_INFO': '.vimba_c',
+    'SIZEOF_VMB_FEATURE_ENUM_ENTRY': '.vimba_c',
+    'EXPECTED_VIMBA_C_VERSION': '.vimba_c',
+    'call_vimba_c': '.vimba_c',
+    'build_vimba_c_call': '.vimba_c',
+    'build_callback_type': '.vimba_c',
+
+    # Exports from vimba_image_transform
+    'VmbImage': '.vimba_image_transform',
+    'VmbImageInfo': '.vimba_image_transform',
+    'VmbDebayerMode': '.vimba_image_transform',
+    'VmbTransformInfo': '.vimba_image_transform',
+    'EXPECTED_VIMBA_IMAGE_TRANSFORM_VERSION': '.vimba_image_transform',
+    'call_vimba_image_transform': '.vimba_image_transform',
+    'PIXEL_FORMAT_TO_LAYOUT': '.vimba_image_transform',
+    'LAYOUT_TO_PIXEL_FORMAT': '.vimba_image_transform',
+    'PIXEL_FORMAT_TO_CHANNELS': '.vimba_image_transform',
+    'query_convertible_formats': '.vimba_image_transform',
+
+    # Not exported, accessing them loads the shared libraries. A star import must stay cheap.
+    'VIMBA_C_VERSION': '.vimba_c',
+    'VIMBA_IMAGE_TRANSFORM_VERSION': '.vimba_image_transform',
+    'PIXEL_FORMAT_CONVERTIBILITY_MAP': '.vimba_image_transform',
+
+    # Not exported, accessed by the test suite
+    '_select_vimba_home': '.vimba_common'
+}
+
+
+# Submodules were bound by the eager imports of earlier versions, e.g. 'vimba.c_binding.vimba_c'.
+_SUBMODULES = ('vimba_common', 'vimba_c', 'vimba_image_transform')
+
+__getattr__, __dir__ = _build_lazy_loader(globals(), _LAZY_EXPORTS, _SUBMODULES)
@@ -25,9 +25,9 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
-import copy
 import ctypes
-from typing import Callable, Any, Tuple
+import functools
+from typing import Callable, Dict, Optional
 from ctypes import c_void_p, c_char_p, byref, sizeof, POINTER as c_ptr, c_char_p as c_str
 from ..util import TraceEnable
 from ..error import VimbaSystemError
@@ -55,9 +55,12 @@ __all__ = [
     'VmbFrame',
     'VmbFeaturePersistSettings',
     'G_VIMBA_C_HANDLE',
-    'VIMBA_C_VERSION',
+    'SIZEOF_VMB_FRAME',
+    'SIZEOF_VMB_FEATURE_INFO',
+    'SIZEOF_VMB_FEATURE_ENUM_ENTRY',
     'EXPECTED_VIMBA_C_VERSION',
     'call_vimba_c',
+    'build_vimba_c_call',
     'build_callback_type'
 ]
 
@@ -80,9 +83,6 @@ class VmbInterface(Uint32Enum):
     CL = 4
     CSI2 = 5
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbAccessMode(Uint32Enum):
     """
@@ -99,9 +99,6 @@ class VmbAccessMode(Uint32Enum):
     Config = 4
     Lite = 8
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbFeatureData(Uint32Enum):
     """
@@ -126,9 +123,6 @@ class VmbFeatureData(Uint32Enum):
     Raw = 7
     None_ = 8
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbFeaturePersist(Uint32Enum):
     """
@@ -144,9 +138,6 @@ class VmbFeaturePersist(Uint32Enum):
     Streamable = 1
     NoLUT = 2
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbFeatureVisibility(Uint32Enum):
     """
@@ -163,9 +154,6 @@ class VmbFeatureVisibility(Uint32Enum):
     Guru = 3
     Invisible = 4
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbFeatureFlags(Uint32Enum):
     """
@@ -187,9 +175,6 @@ class VmbFeatureFlags(Uint32Enum):
     Volatile = 8
     ModifyWrite = 16
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbFrameStatus(Int32Enum):
     """
@@ -204,9 +189,6 @@ class VmbFrameStatus(Int32Enum):
     TooSmall = -2
     Invalid = -3
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbFrameFlags(Uint32Enum):
     """
@@ -223,9 +205,6 @@ class VmbFrameFlags(Uint32Enum):
     FrameID = 4
     Timestamp = 8
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbVersionInfo(ctypes.Structure):
     """
@@ -245,12 +224,13 @@ class VmbVersionInfo(ctypes.Structure):
         return '{}.{}.{}'.format(self.major, self.minor, self.patch)
 
     def __repr__(self):
-        rep = 'VmbVersionInfo'
-        rep += '(major=' + repr(self.major)
-        rep += ',minor=' + repr(self.minor)
-        rep += ',patch=' + repr(self.patch)
-        rep += ')'
-        return rep
+        return ''.join((
+            'VmbVersionInfo',
+            '(major=' + repr(self.major),
+            ',minor=' + repr(self.minor),
+            ',patch=' + repr(self.patch),
+            ')'
+        ))
 
 
 class VmbInterfaceInfo(ctypes.Structure):
@@ -277,14 +257,15 @@ class VmbInterfaceInfo(ctypes.Structure):
     ]
 
     def __repr__(self):
-        rep = 'VmbInterfaceInfo'
-        rep += fmt_repr('(interfaceIdString={}', self.interfaceIdString)
-        rep += fmt_enum_repr(',interfaceType={}', VmbInterface, self.interfaceType)
-        rep += fmt_repr(',interfaceName={}', self.interfaceName)
-        rep += fmt_repr(',serialString={}', self.serialString)
-        rep += fmt_flags_repr(',permittedAccess={}', VmbAccessMode, self.permittedAccess)
-        rep += ')'
-        return rep
+        return ''.join((
+            'VmbInterfaceInfo',
+            fmt_repr('(interfaceIdString={}', self.interfaceIdString),
+            fmt_enum_repr(',interfaceType={}', VmbInterface, self.interfaceType),
+            fmt_repr(',interfaceName={}', self.interfaceName),
+            fmt_repr(',serialString={}', self.serialString),
+            fmt_flags_repr(',permittedAccess={}', VmbAccessMode, self.permittedAccess),
+            ')'
+        ))
 
 
 class VmbCameraInfo(ctypes.Structure):
@@ -314,15 +295,16 @@ class VmbCameraInfo(ctypes.Structure):
     ]
 
     def __repr__(self):
-        rep = 'VmbCameraInfo'
-        rep += fmt_repr('(cameraIdString={}', self.cameraIdString)
-        rep += fmt_repr(',cameraName={}', self.cameraName)
-        rep += fmt_repr(',modelName={}', self.modelName)
-        rep += fmt_repr(',serialString={}', self.serialString)
-        rep += fmt_flags_repr(',permittedAccess={}', VmbAccessMode, self.permittedAccess)
-        rep += fmt_repr(',interfaceIdString={}', self.interfaceIdString)
-        rep += ')'
-        return rep
+        return ''.join((
+            'VmbCameraInfo',
+            fmt_repr('(cameraIdString={}', self.cameraIdString),
+            fmt_repr(',cameraName={}', self.cameraName),
+            fmt_repr(',modelName={}', self.modelName),
+            fmt_repr(',serialString={}', self.serialString),
+            fmt_flags_repr(',permittedAccess={}', VmbAccessMode, self.permittedAccess),
+            fmt_repr(',interfaceIdString={}', self.interfaceIdString),
+            ')'
+        ))
 
 
 class VmbFeatureInfo(ctypes.Structure):
@@ -383,24 +365,25 @@ class VmbFeatureInfo(ctypes.Structure):
     ]
 
     def __repr__(self):
-        rep = 'VmbFeatureInfo'
-        rep += fmt_repr('(name={}', self.name)
-        rep += fmt_enum_repr(',featureDataType={}', VmbFeatureData, self.featureDataType)
-        rep += fmt_flags_repr(',featureFlags={}', VmbFeatureFlags, self.featureFlags)
-        rep += fmt_repr(',category={}', self.category)
-        rep += fmt_repr(',displayName={}', self.displayName)
-        rep += fmt_repr(',pollingTime={}', self.pollingTime)
-        rep += fmt_repr(',unit={}', self.unit)
-        rep += fmt_repr(',representation={}', self.representation)
-        rep += fmt_enum_repr(',visibility={}', VmbFeatureVisibility, self.visibility)
-        rep += fmt_repr(',tooltip={}', self.tooltip)
-        rep += fmt_repr(',description={}', self.description)
-        rep += fmt_repr(',sfncNamespace={}', self.sfncNamespace)
-        rep += fmt_repr(',isStreamable={}', self.isStreamable)
-        rep += fmt_repr(',hasAffectedFeatures={}', self.hasAffectedFeatures)
-        rep += fmt_repr(',hasSelectedFeatures={}', self.hasSelectedFeatures)
-        rep += ')'
-        return rep
+        return ''.join((
+            'VmbFeatureInfo',
+            fmt_repr('(name={}', self.name),
+            fmt_enum_repr(',featureDataType={}', VmbFeatureData, self.featureDataType),
+            fmt_flags_repr(',featureFlags={}', VmbFeatureFlags, self.featureFlags),
+            fmt_repr(',category={}', self.category),
+            fmt_repr(',displayName={}', self.displayName),
+            fmt_repr(',pollingTime={}', self.pollingTime),
+            fmt_repr(',unit={}', self.unit),
+            fmt_repr(',representation={}', self.representation),
+            fmt_enum_repr(',visibility={}', VmbFeatureVisibility, self.visibility),
+            fmt_repr(',tooltip={}', self.tooltip),
+            fmt_repr(',description={}', self.description),
+            fmt_repr(',sfncNamespace={}', self.sfncNamespace),
+            fmt_repr(',isStreamable={}', self.isStreamable),
+            fmt_repr(',hasAffectedFeatures={}', self.hasAffectedFeatures),
+            fmt_repr(',hasSelectedFeatures={}', self.hasSelectedFeatures),
+            ')'
+        ))
 
 
 class VmbFeatureEnumEntry(ctypes.Structure):
@@ -433,16 +416,17 @@ class VmbFeatureEnumEntry(ctypes.Structure):
     ]
 
     def __repr__(self):
-        rep = 'VmbFeatureEnumEntry'
-        rep += fmt_repr('(name={}', self.name)
-        rep += fmt_repr(',displayName={}', self.displayName)
-        rep += fmt_enum_repr(',visibility={}', VmbFeatureVisibility, self.visibility)
-        rep += fmt_repr(',tooltip={}', self.tooltip)
-        rep += fmt_repr(',description={}', self.description)
-        rep += fmt_repr(',sfncNamespace={}', self.sfncNamespace)
-        rep += fmt_repr(',intValue={},', self.intValue)
-        rep += ')'
-        return rep
+        return ''.join((
+            'VmbFeatureEnumEntry',
+            fmt_repr('(name={}', self.name),
+            fmt_repr(',displayName={}', self.displayName),
+            fmt_enum_repr(',visibility={}', VmbFeatureVisibility, self.visibility),
+            fmt_repr(',tooltip={}', self.tooltip),
+            fmt_repr(',description={}', self.description),
+            fmt_repr(',sfncNamespace={}', self.sfncNamespace),
+            fmt_repr(',intValue={},', self.intValue),
+            ')'
+        ))
 
 
 class VmbFrame(ctypes.Structure):
@@ -501,45 +485,48 @@ class VmbFrame(ctypes.Structure):
     ]
 
     def __repr__(self):
-        rep = 'VmbFrame'
-        rep += fmt_repr('(buffer={}', self.buffer)
-        rep += fmt_repr(',bufferSize={}', self.bufferSize)
-        rep += fmt_repr(',context={}', self.context)
-        rep += fmt_enum_repr('receiveStatus: {}', VmbFrameStatus, self.receiveStatus)
-        rep += fmt_flags_repr(',receiveFlags={}', VmbFrameFlags, self.receiveFlags)
-        rep += fmt_repr(',imageSize={}', self.imageSize)
-        rep += fmt_repr(',ancillarySize={}', self.ancillarySize)
-        rep += fmt_enum_repr(',pixelFormat={}', VmbPixelFormat, self.pixelFormat)
-        rep += fmt_repr(',width={}', self.width)
-        rep += fmt_repr(',height={}', self.height)
-        rep += fmt_repr(',offsetX={}', self.offsetX)
-        rep += fmt_repr(',offsetY={}', self.offsetY)
-        rep += fmt_repr(',frameID={}', self.frameID)
-        rep += fmt_repr(',timestamp={}', self.timestamp)
-        rep += ')'
-        return rep
+        return ''.join((
+            'VmbFrame',
+            fmt_repr('(buffer={}', self.buffer),
+            fmt_repr(',bufferSize={}', self.bufferSize),
+            fmt_repr(',context={}', self.context),
+            fmt_enum_repr('receiveStatus: {}', VmbFrameStatus, self.receiveStatus),
+            fmt_flags_repr(',receiveFlags={}', VmbFrameFlags, self.receiveFlags),
+            fmt_repr(',imageSize={}', self.imageSize),
+            fmt_repr(',ancillarySize={}', self.ancillarySize),
+            fmt_enum_repr(',pixelFormat={}', VmbPixelFormat, self.pixelFormat),
+            fmt_repr(',width={}', self.width),
+            fmt_repr(',height={}', self.height),
+            fmt_repr(',offsetX={}', self.offsetX),
+            fmt_repr(',offsetY={}', self.offsetY),
+            fmt_repr(',frameID={}', self.frameID),
+            fmt_repr(',timestamp={}', self.timestamp),
+            ')'
+        ))
 
     def deepcopy_skip_ptr(self, memo):
+        # A new VmbFrame is zero initialized: buffer, bufferSize and context are already
+        # cleared. All scalar fields following context are copied with a single memmove.
         result = VmbFrame()
         memo[id(self)] = result
 
-        result.buffer = None
-        result.bufferSize = 0
-        result.context = (None, None, None, None)
-
-        setattr(result, 'receiveStatus', copy.deepcopy(self.receiveStatus, memo))
-        setattr(result, 'receiveFlags', copy.deepcopy(self.receiveFlags, memo))
-        setattr(result, 'imageSize', copy.deepcopy(self.imageSize, memo))
-        setattr(result, 'ancillarySize', copy.deepcopy(self.ancillarySize, memo))
-        setattr(result, 'pixelFormat', copy.deepcopy(self.pixelFormat, memo))
-        setattr(result, 'width', copy.deepcopy(self.width, memo))
-        setattr(result, 'height', copy.deepcopy(self.height, memo))
-        setattr(result, 'offsetX', copy.deepcopy(self.offsetX, memo))
-        setattr(result, 'offsetY', copy.deepcopy(self.offsetY, memo))
-        setattr(result, 'frameID', copy.deepcopy(self.frameID, memo))
-        setattr(result, 'timestamp', copy.deepcopy(self.timestamp, memo))
+        ctypes.memmove(ctypes.addressof(result) + _VMB_FRAME_TAIL_OFFSET,
+                       ctypes.addressof(self) + _VMB_FRAME_TAIL_OFFSET, _VMB_FRAME_TAIL_SIZE)
         return result
 
+    def copy_into(self, dst):
+        """Copy the entire frame buffer into 'dst' with a single memmove.
+
+        Arguments:
+            dst - Writable ctypes object or memory address providing at least bufferSize bytes,
+                  e.g. a ctypes array or the 'ctypes.data' address of a numpy array.
+        """
+        ctypes.memmove(dst, self.buffer, self.bufferSize)
+
+
+_VMB_FRAME_TAIL_OFFSET = VmbFrame.receiveStatus.offset
+_VMB_FRAME_TAIL_SIZE = ctypes.sizeof(VmbFrame) - _VMB_FRAME_TAIL_OFFSET
+
 
 class VmbFeaturePersistSettings(ctypes.Structure):
     """
@@ -561,17 +548,23 @@ class VmbFeaturePersistSettings(ctypes.Structure):
     ]
 
     def __repr__(self):
-        rep = 'VmbFrame'
-        rep += fmt_enum_repr('(persistType={}', VmbFeaturePersist, self.persistType)
-        rep += fmt_repr(',maxIterations={}', self.maxIterations)
-        rep += fmt_repr(',loggingLevel={}', self.loggingLevel)
-        rep += ')'
-        return rep
+        return ''.join((
+            'VmbFrame',
+            fmt_enum_repr('(persistType={}', VmbFeaturePersist, self.persistType),
+            fmt_repr(',maxIterations={}', self.maxIterations),
+            fmt_repr(',loggingLevel={}', self.loggingLevel),
+            ')'
+        ))
 
 
 G_VIMBA_C_HANDLE = VmbHandle(1)
 
-VIMBA_C_VERSION = None
+# Structure sizes passed along with structure pointers. Computed once instead of per call.
+SIZEOF_VMB_FRAME = sizeof(VmbFrame)
+SIZEOF_VMB_FEATURE_INFO = sizeof(VmbFeatureInfo)
+SIZEOF_VMB_FEATURE_ENUM_ENTRY = sizeof(VmbFeatureEnumEntry)
+
+VIMBA_C_VERSION: str
 EXPECTED_VIMBA_C_VERSION = '1.9.0'
 
 # For detailed information on the signatures see "VimbaC.h"
@@ -639,15 +632,32 @@ _SIGNATURES = {
 }
 
 
-def _attach_signatures(lib_handle):
+# Function pointers by name. Signatures are attached on first use of a function instead of
+# binding all VimbaC functions during import, short-lived processes only resolve the few
+# functions they actually call.
+_FUNCS: Dict[str, Callable] = {}
+
+
+def _bind_function(lib_handle, func_name: str):
     global _SIGNATURES
+    global _FUNCS
 
-    for function_name, signature in _SIGNATURES.items():
-        fn = getattr(lib_handle, function_name)
-        fn.restype, fn.argtypes = signature
-        fn.errcheck = _eval_vmberror
+    try:
+        restype, argtypes = _SIGNATURES[func_name]
 
-    return lib_handle
+    except KeyError:
+        raise AttributeError('VimbaC has no function {}'.format(func_name)) from None
+
+    fn = getattr(lib_handle, func_name)
+
+    # Receive error codes as plain integers. Using VmbError as restype constructs an enum
+    # instance on every call, the conversion is only required for failed calls. Results are
+    # evaluated by the caller instead of an errcheck callback, saving a Python call per call.
+    fn.restype = VmbInt32 if restype is VmbError else restype
+    fn.argtypes = argtypes
+
+    _FUNCS[func_name] = fn
+    return fn
 
 
 def _check_version(lib_handle):
@@ -655,7 +665,7 @@ def _check_version(lib_handle):
     global VIMBA_C_VERSION
 
     v = VmbVersionInfo()
-    lib_handle.VmbVersionQuery(byref(v), sizeof(v))
+    _eval_vmberror(_bind_function(lib_handle, 'VmbVersionQuery')(byref(v), sizeof(v)))
 
     VIMBA_C_VERSION = str(v)
 
@@ -670,12 +680,22 @@ def _check_version(lib_handle):
     return lib_handle
 
 
-def _eval_vmberror(result: VmbError, func: Callable[..., Any], *args: Tuple[Any, ...]):
-    if result not in (VmbError.Success, None):
-        raise VimbaCError(result)
+def _eval_vmberror(result: Optional[int]):
+    if result:
+        raise VimbaCError(VmbError(result))
+
+
+# VimbaC is loaded on first use. Importing the bindings doesn't require a Vimba installation.
+_lib_instance = None
 
 
-_lib_instance = _check_version(_attach_signatures(load_vimba_lib('VimbaC')))
+def _get_lib_instance():
+    global _lib_instance
+
+    if _lib_instance is None:
+        _lib_instance = _check_version(load_vimba_lib('VimbaC'))
+
+    return _lib_instance
 
 
 @TraceEnable()
@@ -753,14 +773,63 @@ def call_vimba_c(func_name: str, *args):
         VmbCameraSettingsSave
         VmbCameraSettingsLoad
     """
-    global _lib_instance
-    getattr(_lib_instance, func_name)(*args)
+    global _FUNCS
 
+    try:
+        func = _FUNCS[func_name]
 
-def build_callback_type(*args):
-    global _lib_instance
+    except KeyError:
+        func = _bind_function(_get_lib_instance(), func_name)
+
+    # VmbError.Success is 0 and functions without return value return None. Both are falsy,
+    # the common case costs a single truth test.
+    result = func(*args)
+
+    if result:
+        raise VimbaCError(VmbError(result))
 
-    lib_type = type(_lib_instance)
+
+def build_vimba_c_call(func_name: str):
+    """Build a dedicated callable for a single VimbaC function.
+
+    The returned function behaves like call_vimba_c(func_name, ...) but resolves the function
+    only once. Intended for VimbaC functions called for each frame during streaming.
+
+    Arguments:
+        func_name: The function name from VimbaC to be called.
+
+    Raises:
+        AttributeError if func with name 'func_name' does not exist.
+    """
+    global _FUNCS
+
+    try:
+        func = _FUNCS[func_name]
+
+    except KeyError:
+        func = _bind_function(_get_lib_instance(), func_name)
+
+    # The closure already binds the function pointer directly, leaving one ctypes call and a
+    # truth test per invocation. Generating arity specific wrappers from source would only
+    # remove the varargs packing, which is negligible compared to the foreign call itself.
+    def call(*args):
+        result = func(*args)
+
+        if result:
+            raise VimbaCError(VmbError(result))
+
+    call.__name__ = call.__qualname__ = func_name
+
+    return TraceEnable()(call)
+
+
+# Constructing a function prototype creates a new ctypes type. Features and cameras share a
+# few callback signatures, therefore each prototype is only built once. The calling convention
+# follows the loaded library, not the platform: 64 bit Windows loads VimbaC as CDLL as well.
+# ctypes.WinDLL is only evaluated for libraries that are not a CDLL, i.e. never on Linux.
+@functools.lru_cache(maxsize=None)
+def build_callback_type(*args):
+    lib_type = type(_get_lib_instance())
 
     if lib_type == ctypes.CDLL:
         return ctypes.CFUNCTYPE(*args)
@@ -770,3 +839,13 @@ def build_callback_type(*args):
 
     else:
         raise VimbaSystemError('Unknown Library Type. Abort.')
+
+
+def __getattr__(name: str):
+    # Module level attributes depending on the loaded VimbaC library are resolved on first
+    # access and cached within the module namespace afterwards.
+    if name == 'VIMBA_C_VERSION':
+        _get_lib_instance()
+        return globals()[name]
+
+    raise AttributeError('module {} has no attribute {}'.format(__name__, name))
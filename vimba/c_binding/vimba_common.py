@@ -30,8 +30,9 @@ import enum
 import os
 import sys
 import platform
+import operator
 import functools
-from typing import Tuple, List
+from typing import Tuple, List, Iterator
 from ..error import VimbaSystemError
 
 
@@ -64,16 +65,25 @@ __all__ = [
 
 
 # Types
+# Enum arguments are passed to ctypes as plain integers. ctypes converts them to a C int without
+# constructing an intermediate c_int or c_uint instance for every call. str() returns the member
+# name, read from _name_ directly: Enum.name is a descriptor and about twice as slow to access.
 class Int32Enum(enum.IntEnum):
     @classmethod
     def from_param(cls, obj):
-        return ctypes.c_int(obj)
+        return operator.index(obj)
+
+    def __str__(self):
+        return self._name_
 
 
 class Uint32Enum(enum.IntEnum):
     @classmethod
     def from_param(cls, obj):
-        return ctypes.c_uint(obj)
+        return operator.index(obj)
+
+    def __str__(self):
+        return self._name_
 
 
 # Aliases for vmb base types
@@ -146,27 +156,13 @@ class VmbError(Int32Enum):
     Incomplete = -19
     IO = -20
 
-    def __str__(self):
-        return self._name_
-
-
-class _VmbPixel(Uint32Enum):
-    Mono = 0x01000000
-    Color = 0x02000000
-
-
-class _VmbPixelOccupy(Uint32Enum):
-    Bit8 = 0x00080000
-    Bit10 = 0x000A0000
-    Bit12 = 0x000C0000
-    Bit14 = 0x000E0000
-    Bit16 = 0x00100000
-    Bit24 = 0x00180000
-    Bit32 = 0x00200000
-    Bit48 = 0x00300000
-    Bit64 = 0x00400000
-
 
+# VmbPixelFormat values are composed of three parts, noted behind each member:
+#   Pixel type:     Mono = 0x01000000, Color = 0x02000000
+#   Occupied bits:  BitN = N << 16, e.g. Bit8 = 0x00080000, Bit16 = 0x00100000
+#   Format id:      lower 16 bits
+# The values are spelled out as literals, composing them from enum members would cost an
+# enum operation per member on every import.
 class VmbPixelFormat(Uint32Enum):
     """
     Enum containing Pixelformats
@@ -277,72 +273,69 @@ class VmbPixelFormat(Uint32Enum):
                                (PFNC:YCbCr8_CbYCr) - identical to Yuv444
     """
     None_ = 0
-    Mono8 = _VmbPixel.Mono | _VmbPixelOccupy.Bit8 | 0x0001
-    Mono10 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0003
-    Mono10p = _VmbPixel.Mono | _VmbPixelOccupy.Bit10 | 0x0046
-    Mono12 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0005
-    Mono12Packed = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x0006
-    Mono12p = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x0047
-    Mono14 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0025
-    Mono16 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0007
-    BayerGR8 = _VmbPixel.Mono | _VmbPixelOccupy.Bit8 | 0x0008
-    BayerRG8 = _VmbPixel.Mono | _VmbPixelOccupy.Bit8 | 0x0009
-    BayerGB8 = _VmbPixel.Mono | _VmbPixelOccupy.Bit8 | 0x000A
-    BayerBG8 = _VmbPixel.Mono | _VmbPixelOccupy.Bit8 | 0x000B
-    BayerGR10 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x000C
-    BayerRG10 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x000D
-    BayerGB10 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x000E
-    BayerBG10 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x000F
-    BayerGR12 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0010
-    BayerRG12 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0011
-    BayerGB12 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0012
-    BayerBG12 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0013
-    BayerGR12Packed = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x002A
-    BayerRG12Packed = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x002B
-    BayerGB12Packed = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x002C
-    BayerBG12Packed = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x002D
-    BayerGR10p = _VmbPixel.Mono | _VmbPixelOccupy.Bit10 | 0x0056
-    BayerRG10p = _VmbPixel.Mono | _VmbPixelOccupy.Bit10 | 0x0058
-    BayerGB10p = _VmbPixel.Mono | _VmbPixelOccupy.Bit10 | 0x0054
-    BayerBG10p = _VmbPixel.Mono | _VmbPixelOccupy.Bit10 | 0x0052
-    BayerGR12p = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x0057
-    BayerRG12p = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x0059
-    BayerGB12p = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x0055
-    BayerBG12p = _VmbPixel.Mono | _VmbPixelOccupy.Bit12 | 0x0053
-    BayerGR16 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x002E
-    BayerRG16 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x002F
-    BayerGB16 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0030
-    BayerBG16 = _VmbPixel.Mono | _VmbPixelOccupy.Bit16 | 0x0031
-    Rgb8 = _VmbPixel.Color | _VmbPixelOccupy.Bit24 | 0x0014
-    Bgr8 = _VmbPixel.Color | _VmbPixelOccupy.Bit24 | 0x0015
-    Rgb10 = _VmbPixel.Color | _VmbPixelOccupy.Bit48 | 0x0018
-    Bgr10 = _VmbPixel.Color | _VmbPixelOccupy.Bit48 | 0x0019
-    Rgb12 = _VmbPixel.Color | _VmbPixelOccupy.Bit48 | 0x001A
-    Bgr12 = _VmbPixel.Color | _VmbPixelOccupy.Bit48 | 0x001B
-    Rgb14 = _VmbPixel.Color | _VmbPixelOccupy.Bit48 | 0x005E
-    Bgr14 = _VmbPixel.Color | _VmbPixelOccupy.Bit48 | 0x004A
-    Rgb16 = _VmbPixel.Color | _VmbPixelOccupy.Bit48 | 0x0033
-    Bgr16 = _VmbPixel.Color | _VmbPixelOccupy.Bit48 | 0x004B
-    Argb8 = _VmbPixel.Color | _VmbPixelOccupy.Bit32 | 0x0016
+    Mono8 = 0x01080001  # Mono | Bit8 | 0x0001
+    Mono10 = 0x01100003  # Mono | Bit16 | 0x0003
+    Mono10p = 0x010A0046  # Mono | Bit10 | 0x0046
+    Mono12 = 0x01100005  # Mono | Bit16 | 0x0005
+    Mono12Packed = 0x010C0006  # Mono | Bit12 | 0x0006
+    Mono12p = 0x010C0047  # Mono | Bit12 | 0x0047
+    Mono14 = 0x01100025  # Mono | Bit16 | 0x0025
+    Mono16 = 0x01100007  # Mono | Bit16 | 0x0007
+    BayerGR8 = 0x01080008  # Mono | Bit8 | 0x0008
+    BayerRG8 = 0x01080009  # Mono | Bit8 | 0x0009
+    BayerGB8 = 0x0108000A  # Mono | Bit8 | 0x000A
+    BayerBG8 = 0x0108000B  # Mono | Bit8 | 0x000B
+    BayerGR10 = 0x0110000C  # Mono | Bit16 | 0x000C
+    BayerRG10 = 0x0110000D  # Mono | Bit16 | 0x000D
+    BayerGB10 = 0x0110000E  # Mono | Bit16 | 0x000E
+    BayerBG10 = 0x0110000F  # Mono | Bit16 | 0x000F
+    BayerGR12 = 0x01100010  # Mono | Bit16 | 0x0010
+    BayerRG12 = 0x01100011  # Mono | Bit16 | 0x0011
+    BayerGB12 = 0x01100012  # Mono | Bit16 | 0x0012
+    BayerBG12 = 0x01100013  # Mono | Bit16 | 0x0013
+    BayerGR12Packed = 0x010C002A  # Mono | Bit12 | 0x002A
+    BayerRG12Packed = 0x010C002B  # Mono | Bit12 | 0x002B
+    BayerGB12Packed = 0x010C002C  # Mono | Bit12 | 0x002C
+    BayerBG12Packed = 0x010C002D  # Mono | Bit12 | 0x002D
+    BayerGR10p = 0x010A0056  # Mono | Bit10 | 0x0056
+    BayerRG10p = 0x010A0058  # Mono | Bit10 | 0x0058
+    BayerGB10p = 0x010A0054  # Mono | Bit10 | 0x0054
+    BayerBG10p = 0x010A0052  # Mono | Bit10 | 0x0052
+    BayerGR12p = 0x010C0057  # Mono | Bit12 | 0x0057
+    BayerRG12p = 0x010C0059  # Mono | Bit12 | 0x0059
+    BayerGB12p = 0x010C0055  # Mono | Bit12 | 0x0055
+    BayerBG12p = 0x010C0053  # Mono | Bit12 | 0x0053
+    BayerGR16 = 0x0110002E  # Mono | Bit16 | 0x002E
+    BayerRG16 = 0x0110002F  # Mono | Bit16 | 0x002F
+    BayerGB16 = 0x01100030  # Mono | Bit16 | 0x0030
+    BayerBG16 = 0x01100031  # Mono | Bit16 | 0x0031
+    Rgb8 = 0x02180014  # Color | Bit24 | 0x0014
+    Bgr8 = 0x02180015  # Color | Bit24 | 0x0015
+    Rgb10 = 0x02300018  # Color | Bit48 | 0x0018
+    Bgr10 = 0x02300019  # Color | Bit48 | 0x0019
+    Rgb12 = 0x0230001A  # Color | Bit48 | 0x001A
+    Bgr12 = 0x0230001B  # Color | Bit48 | 0x001B
+    Rgb14 = 0x0230005E  # Color | Bit48 | 0x005E
+    Bgr14 = 0x0230004A  # Color | Bit48 | 0x004A
+    Rgb16 = 0x02300033  # Color | Bit48 | 0x0033
+    Bgr16 = 0x0230004B  # Color | Bit48 | 0x004B
+    Argb8 = 0x02200016  # Color | Bit32 | 0x0016
     Rgba8 = Argb8
-    Bgra8 = _VmbPixel.Color | _VmbPixelOccupy.Bit32 | 0x0017
-    Rgba10 = _VmbPixel.Color | _VmbPixelOccupy.Bit64 | 0x005F
-    Bgra10 = _VmbPixel.Color | _VmbPixelOccupy.Bit64 | 0x004C
-    Rgba12 = _VmbPixel.Color | _VmbPixelOccupy.Bit64 | 0x0061
-    Bgra12 = _VmbPixel.Color | _VmbPixelOccupy.Bit64 | 0x004E
-    Rgba14 = _VmbPixel.Color | _VmbPixelOccupy.Bit64 | 0x0063
-    Bgra14 = _VmbPixel.Color | _VmbPixelOccupy.Bit64 | 0x0050
-    Rgba16 = _VmbPixel.Color | _VmbPixelOccupy.Bit64 | 0x0064
-    Bgra16 = _VmbPixel.Color | _VmbPixelOccupy.Bit64 | 0x0051
-    Yuv411 = _VmbPixel.Color | _VmbPixelOccupy.Bit12 | 0x001E
-    Yuv422 = _VmbPixel.Color | _VmbPixelOccupy.Bit16 | 0x001F
-    Yuv444 = _VmbPixel.Color | _VmbPixelOccupy.Bit24 | 0x0020
-    YCbCr411_8_CbYYCrYY = _VmbPixel.Color | _VmbPixelOccupy.Bit12 | 0x003C
-    YCbCr422_8_CbYCrY = _VmbPixel.Color | _VmbPixelOccupy.Bit16 | 0x0043
-    YCbCr8_CbYCr = _VmbPixel.Color | _VmbPixelOccupy.Bit24 | 0x003A
-
-    def __str__(self):
-        return self._name_
+    Bgra8 = 0x02200017  # Color | Bit32 | 0x0017
+    Rgba10 = 0x0240005F  # Color | Bit64 | 0x005F
+    Bgra10 = 0x0240004C  # Color | Bit64 | 0x004C
+    Rgba12 = 0x02400061  # Color | Bit64 | 0x0061
+    Bgra12 = 0x0240004E  # Color | Bit64 | 0x004E
+    Rgba14 = 0x02400063  # Color | Bit64 | 0x0063
+    Bgra14 = 0x02400050  # Color | Bit64 | 0x0050
+    Rgba16 = 0x02400064  # Color | Bit64 | 0x0064
+    Bgra16 = 0x02400051  # Color | Bit64 | 0x0051
+    Yuv411 = 0x020C001E  # Color | Bit12 | 0x001E
+    Yuv422 = 0x0210001F  # Color | Bit16 | 0x001F
+    Yuv444 = 0x02180020  # Color | Bit24 | 0x0020
+    YCbCr411_8_CbYYCrYY = 0x020C003C  # Color | Bit12 | 0x003C
+    YCbCr422_8_CbYCrY = 0x02100043  # Color | Bit16 | 0x0043
+    YCbCr8_CbYCr = 0x0218003A  # Color | Bit24 | 0x003A
 
 
 class VimbaCError(Exception):
@@ -354,12 +347,13 @@ class VimbaCError(Exception):
     def __init__(self, c_error: VmbError):
         super().__init__(repr(c_error))
         self.__c_error = c_error
+        self.__msg = 'VimbaCError({!r})'.format(c_error)
 
     def __str__(self):
-        return repr(self)
+        return self.__msg
 
     def __repr__(self):
-        return 'VimbaCError({})'.format(repr(self.__c_error))
+        return self.__msg
 
     def get_error_code(self) -> VmbError:
         """ Get contained Error Code """
@@ -367,33 +361,32 @@ class VimbaCError(Exception):
 
 
 # Utility Functions
-def _split_into_powers_of_two(num: int) -> Tuple[int, ...]:
-    result = []
-    for mask in [1 << i for i in range(32)]:
-        if mask & num:
-            result.append(mask)
-
-    if not result:
-        result.append(0)
+def _iter_bits(num: int) -> Iterator[int]:
+    # Flags are 32 bit wide. Isolate the lowest set bit until none is left, this visits only
+    # set bits instead of testing all 32 masks.
+    num &= 0xFFFFFFFF
 
-    return tuple(result)
+    while num:
+        bit = num & -num
+        yield bit
+        num ^= bit
 
 
-def _split_flags_into_enum(num: int, enum_type):
-    return [enum_type(val) for val in _split_into_powers_of_two(num)]
+# Feature infos and frames repeat the same few flag masks. Decoding is a pure function of its
+# arguments, repeated masks are served from a cache.
+@functools.lru_cache(maxsize=1024)
+def _split_flags_into_enum(num: int, enum_type) -> Tuple[enum.IntEnum, ...]:
+    return tuple(enum_type(bit) for bit in _iter_bits(num)) or (enum_type(0),)
 
 
 def _repr_flags_list(enum_type, flag_val: int):
     values = _split_flags_into_enum(flag_val, enum_type)
 
     if values:
-        def fold_func(acc, arg):
-            return '{} {}'.format(acc, repr(arg))
-
-        return functools.reduce(fold_func, values, '')
+        return ' ' + ' '.join(map(repr, values))
 
     else:
-        return '{}'.format(repr(enum_type(0)))
+        return repr(enum_type(0))
 
 
 def decode_cstr(val: bytes) -> str:
@@ -422,7 +415,7 @@ def decode_flags(enum_type, enum_val: int):
         Attribute error a set value is not within the given 'enum_type'.
     """
 
-    return tuple(_split_flags_into_enum(enum_val, enum_type))
+    return _split_flags_into_enum(enum_val, enum_type)
 
 
 def fmt_repr(fmt: str, val):
@@ -459,6 +452,17 @@ def fmt_flags_repr(fmt: str, enum_type, enum_val):
     return fmt.format(_repr_flags_list(enum_type, enum_val))
 
 
+# Platform properties can't change while the process is running, they are queried once.
+# The interpreter is a 64 bit binary if maxsize exceeds 2^32. This seems to be rather hacky,
+# but it seems to be the way to do this....
+_PLATFORM = sys.platform
+_MACHINE = platform.machine()
+_IS_64BIT = sys.maxsize > 2**32
+
+
+# Resolving the installation path inspects the environment and the file system. The resulting
+# handle stays valid for the whole process, each library is resolved and loaded only once.
+@functools.lru_cache(maxsize=None)
 def load_vimba_lib(vimba_project: str):
     """ Load shared library shipped with the Vimba installation
 
@@ -477,61 +481,54 @@ def load_vimba_lib(vimba_project: str):
         'win32': _load_under_windows
     }
 
-    if sys.platform not in platform_handlers:
+    if _PLATFORM not in platform_handlers:
         msg = 'Abort. Unsupported Platform ({}) detected.'
-        raise VimbaSystemError(msg.format(sys.platform))
+        raise VimbaSystemError(msg.format(_PLATFORM))
+
+    return platform_handlers[_PLATFORM](vimba_project)
 
-    return platform_handlers[sys.platform](vimba_project)
+
+# Library directory by machine architecture and interpreter bitness. 64 bit machines may run
+# a 32 bit interpreter, on 32 bit machines the interpreter is always 32 bit.
+_LINUX_LIB_DIRS = {
+    ('x86_64', True): 'x86_64bit',
+    ('x86_64', False): 'x86_32bit',
+    ('i386', False): 'x86_32bit',
+    ('i686', False): 'x86_32bit',
+    ('aarch64', True): 'arm_64bit',
+    ('aarch64', False): 'arm_32bit',
+    ('armv7l', False): 'arm_32bit'
+}
 
 
 def _load_under_linux(vimba_project: str):
     # Construct VimbaHome based on TL installation paths
-    path_list: List[str] = []
-    tl32_path = os.environ.get('GENICAM_GENTL32_PATH', "")
-    if tl32_path:
-        path_list += tl32_path.split(':')
-    tl64_path = os.environ.get('GENICAM_GENTL64_PATH', "")
-    if tl64_path:
-        path_list += tl64_path.split(':')
+    tl_paths = os.environ.get('GENICAM_GENTL32_PATH', '').split(os.pathsep)
+    tl_paths += os.environ.get('GENICAM_GENTL64_PATH', '').split(os.pathsep)
 
     # Remove empty strings from path_list if there are any.
-    # Necessary because the GENICAM_GENTLXX_PATH variable might start with a :
-    path_list = [path for path in path_list if path]
+    # Necessary because the GENICAM_GENTLXX_PATH variable might start with a : or be unset
+    path_list = [path for path in tl_paths if path]
 
     # Early return if required variables are not set.
     if not path_list:
         raise VimbaSystemError('No TL detected. Please verify Vimba installation.')
 
-    vimba_home_candidates: List[str] = []
-    for path in path_list:
-        vimba_home = os.path.dirname(os.path.dirname(os.path.dirname(path)))
-
-        if vimba_home not in vimba_home_candidates:
-            vimba_home_candidates.append(vimba_home)
+    # Remove duplicates while keeping the order of first occurrence
+    vimba_home_candidates: List[str] = list(dict.fromkeys(
+        os.path.dirname(os.path.dirname(os.path.dirname(path))) for path in path_list
+    ))
 
     # Select the most likely directory from the candidates
     vimba_home = _select_vimba_home(vimba_home_candidates)
 
-    arch = platform.machine()
+    arch = _MACHINE
 
-    # Linux x86 64 Bit (Requires additional interpreter version check)
-    if arch == 'x86_64':
-        dir_ = 'x86_64bit' if _is_python_64_bit() else 'x86_32bit'
-
-    # Linux x86 32 Bit
-    elif arch in ('i386', 'i686'):
-        dir_ = 'x86_32bit'
-
-    # Linux arm 64 Bit (Requires additional interpreter version check)
-    elif arch == 'aarch64':
-        dir_ = 'arm_64bit' if _is_python_64_bit() else 'arm_32bit'
+    try:
+        dir_ = _LINUX_LIB_DIRS[(arch, _IS_64BIT)]
 
-    # Linux arm 32 Bit:
-    elif arch == 'armv7l':
-        dir_ = 'arm_32bit'
-
-    else:
-        raise VimbaSystemError('Unknown Architecture \'{}\'. Abort'.format(arch))
+    except KeyError:
+        raise VimbaSystemError('Unknown Architecture \'{}\'. Abort'.format(arch)) from None
 
     lib_name = 'lib{}.so'.format(vimba_project)
     lib_path = os.path.join(vimba_home, vimba_project, 'DynamicLib', dir_, lib_name)
@@ -552,7 +549,7 @@ def _load_under_windows(vimba_project: str):
     if vimba_home is None:
         raise VimbaSystemError('Variable VIMBA_HOME not set. Please verify Vimba installation.')
 
-    load_64bit = True if (platform.machine() == 'AMD64') and _is_python_64_bit() else False
+    load_64bit = (_MACHINE == 'AMD64') and _IS_64BIT
     lib_name = '{}.dll'.format(vimba_project)
     lib_path = os.path.join(vimba_home, vimba_project, 'Bin', 'Win64' if load_64bit else 'Win32',
                             lib_name)
@@ -589,10 +586,10 @@ def _select_vimba_home(candidates: List[str]) -> str:
     Raises:
         VimbaSystemError if multiple VIMBA_HOME directories were found in candidates
     """
-    most_likely_candidates = []
-    for candidate in candidates:
-        if 'vimba' in candidate.lower():
-            most_likely_candidates.append(candidate)
+    # All candidates are checked, the error messages list all considered or all matching paths.
+    # The candidate list is small, there is nothing to gain by stopping early.
+    most_likely_candidates = [candidate for candidate in candidates
+                              if 'vimba' in candidate.lower()]
 
     if len(most_likely_candidates) == 0:
         raise VimbaSystemError('No suitable Vimba installation found. The following paths '
@@ -602,10 +599,3 @@ def _select_vimba_home(candidates: List[str]) -> str:
                                '{}'.format(most_likely_candidates))
 
     return most_likely_candidates[0]
-
-
-def _is_python_64_bit() -> bool:
-    # Query if the currently running python interpreter is build as 64 bit binary.
-    # The default method of getting this information seems to be rather hacky
-    # (check if maxint > 2^32) but it seems to be the way to do this....
-    return True if sys.maxsize > 2**32 else False
@@ -26,14 +26,15 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import ctypes
+import functools
 import sys
 from ctypes import byref, sizeof, c_char_p, POINTER as c_ptr
-from typing import Callable, Any, Tuple, Dict, List
+from typing import Callable, Optional, Tuple, Dict
 
 from ..error import VimbaSystemError
 from ..util import TraceEnable
 from .vimba_common import Uint32Enum, VmbUint32, VmbInt32, VmbError, VmbFloat, VimbaCError, \
-                          VmbPixelFormat, load_vimba_lib, fmt_repr, fmt_enum_repr
+                          VmbPixelFormat, load_vimba_lib
 
 
 __all__ = [
@@ -46,12 +47,12 @@ __all__ = [
     'VmbImage',
     'VmbImageInfo',
     'VmbTransformInfo',
-    'VIMBA_IMAGE_TRANSFORM_VERSION',
     'EXPECTED_VIMBA_IMAGE_TRANSFORM_VERSION',
     'call_vimba_image_transform',
     'PIXEL_FORMAT_TO_LAYOUT',
     'LAYOUT_TO_PIXEL_FORMAT',
-    'PIXEL_FORMAT_CONVERTIBILITY_MAP'
+    'PIXEL_FORMAT_TO_CHANNELS',
+    'query_convertible_formats'
 ]
 
 
@@ -78,9 +79,6 @@ class VmbBayerPattern(Uint32Enum):
     MGCY = 131
     LAST = 255
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbEndianness(Uint32Enum):
     """Enum defining Endian Formats
@@ -93,9 +91,6 @@ class VmbEndianness(Uint32Enum):
     BIG = 1
     LAST = 255
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbAligment(Uint32Enum):
     """Enum defining image alignment
@@ -108,9 +103,6 @@ class VmbAligment(Uint32Enum):
     LSB = 1
     LAST = 255
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbAPIInfo(Uint32Enum):
     """API Info Types
@@ -127,9 +119,6 @@ class VmbAPIInfo(Uint32Enum):
     TECHNOLOGY = 3
     LAST = 4
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbPixelLayout(Uint32Enum):
     """Image Pixel Layout Information. C Header offers no further documentation."""
@@ -156,9 +145,6 @@ class VmbPixelLayout(Uint32Enum):
     CbYCr444 = YUV444
     LAST = 19
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbColorSpace(Uint32Enum):
     """Image Color space. C Header offers no further documentation."""
@@ -166,9 +152,6 @@ class VmbColorSpace(Uint32Enum):
     ITU_BT709 = 1
     ITU_BT601 = 2
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbDebayerMode(Uint32Enum):
     """Debayer Mode. C Header offers no further documentation."""
@@ -178,9 +161,6 @@ class VmbDebayerMode(Uint32Enum):
     Mode_LCAAV = 3
     Mode_YUV422 = 4
 
-    def __str__(self):
-        return self._name_
-
 
 class VmbTransformType(Uint32Enum):
     """TransformType Mode. C Header offers no further documentation."""
@@ -191,8 +171,11 @@ class VmbTransformType(Uint32Enum):
     Offset = 4
     Gain = 5
 
-    def __str__(self):
-        return self._name_
+
+_PIXEL_INFO_REPR = ('VmbPixelInfo(BitsPerPixel={!r},BitsUsed={!r},Alignment={!r},Endianness={!r}'
+                    ',PixelLayout={!r},BayerPattern={!r},Reserved={!r})')
+_IMAGE_INFO_REPR = 'VmbImageInfo(Width={!r},Height={!r},Stride={!r},PixelInfo={!r})'
+_IMAGE_REPR = 'VmbImage(Size={!r},Data={!r},ImageInfo={!r})'
 
 
 class VmbPixelInfo(ctypes.Structure):
@@ -208,16 +191,13 @@ class VmbPixelInfo(ctypes.Structure):
     ]
 
     def __repr__(self):
-        rep = 'VmbPixelInfo'
-        rep += fmt_repr('(BitsPerPixel={}', self.BitsPerPixel)
-        rep += fmt_repr(',BitsUsed={}', self.BitsUsed)
-        rep += fmt_enum_repr(',Alignment={}', VmbAligment, self.Alignment)
-        rep += fmt_enum_repr(',Endianness={}', VmbEndianness, self.Endianness)
-        rep += fmt_enum_repr(',PixelLayout={}', VmbPixelLayout, self.PixelLayout)
-        rep += fmt_enum_repr(',BayerPattern={}', VmbBayerPattern, self.BayerPattern)
-        rep += fmt_enum_repr(',Reserved={}', VmbColorSpace, self.Reserved)
-        rep += ')'
-        return rep
+        # A single format call per repr. VmbImage reprs are nested three levels deep, and
+        # per-field helper calls add up when images are traced.
+        return _PIXEL_INFO_REPR.format(
+            self.BitsPerPixel, self.BitsUsed, VmbAligment(self.Alignment),
+            VmbEndianness(self.Endianness), VmbPixelLayout(self.PixelLayout),
+            VmbBayerPattern(self.BayerPattern), VmbColorSpace(self.Reserved)
+        )
 
 
 class VmbImageInfo(ctypes.Structure):
@@ -230,13 +210,7 @@ class VmbImageInfo(ctypes.Structure):
     ]
 
     def __repr__(self):
-        rep = 'VmbImageInfo'
-        rep += fmt_repr('(Width={}', self.Width)
-        rep += fmt_repr(',Height={}', self.Height)
-        rep += fmt_repr(',Stride={}', self.Stride)
-        rep += fmt_repr(',PixelInfo={}', self.PixelInfo)
-        rep += ')'
-        return rep
+        return _IMAGE_INFO_REPR.format(self.Width, self.Height, self.Stride, self.PixelInfo)
 
 
 class VmbImage(ctypes.Structure):
@@ -248,12 +222,7 @@ class VmbImage(ctypes.Structure):
     ]
 
     def __repr__(self):
-        rep = 'VmbImage'
-        rep += fmt_repr('(Size={}', self.Size)
-        rep += fmt_repr(',Data={}', self.Data)
-        rep += fmt_repr(',ImageInfo={}', self.ImageInfo)
-        rep += ')'
-        return rep
+        return _IMAGE_REPR.format(self.Size, self.Data, self.ImageInfo)
 
 
 class VmbTransformParameterMatrix3x3(ctypes.Structure):
@@ -311,7 +280,8 @@ class VmbTransformInfo(ctypes.Structure):
 
 
 # API
-VIMBA_IMAGE_TRANSFORM_VERSION = None
+VIMBA_IMAGE_TRANSFORM_VERSION: str
+
 if sys.platform == 'linux':
     EXPECTED_VIMBA_IMAGE_TRANSFORM_VERSION = '1.0'
 
@@ -336,13 +306,25 @@ _SIGNATURES = {
 }
 
 
+# Function pointers by name, filled once signatures are attached. Looking functions up here
+# avoids the attribute lookup on the library handle for each call.
+_FUNCS: Dict[str, Callable] = {}
+
+
 def _attach_signatures(lib_handle):
     global _SIGNATURES
+    global _FUNCS
 
-    for function_name, signature in _SIGNATURES.items():
+    for function_name, (restype, argtypes) in _SIGNATURES.items():
         fn = getattr(lib_handle, function_name)
-        fn.restype, fn.argtypes = signature
-        fn.errcheck = _eval_vmberror
+
+        # Receive error codes as plain integers. Using VmbError as restype constructs an enum
+        # instance on every call, the conversion is only required for failed calls. Results are
+        # evaluated by the caller instead of an errcheck callback, saving a Python call per call.
+        fn.restype = VmbInt32 if restype is VmbError else restype
+        fn.argtypes = argtypes
+
+        _FUNCS[function_name] = fn
 
     return lib_handle
 
@@ -352,7 +334,7 @@ def _check_version(lib_handle):
     global VIMBA_IMAGE_TRANSFORM_VERSION
 
     v = VmbUint32()
-    lib_handle.VmbGetVersion(byref(v))
+    _eval_vmberror(lib_handle.VmbGetVersion(byref(v)))
 
     VIMBA_IMAGE_TRANSFORM_VERSION = '{}.{}'.format((v.value >> 24) & 0xff, (v.value >> 16) & 0xff)
 
@@ -368,12 +350,23 @@ def _check_version(lib_handle):
     return lib_handle
 
 
-def _eval_vmberror(result: VmbError, func: Callable[..., Any], *args: Tuple[Any, ...]):
-    if result not in (VmbError.Success, None):
-        raise VimbaCError(result)
+def _eval_vmberror(result: Optional[int]):
+    if result:
+        raise VimbaCError(VmbError(result))
+
+
+# VimbaImageTransform is only required for pixel format conversions. Loading is deferred
+# until the first access to avoid the cost for applications never converting frames.
+_lib_instance = None
+
+
+def _get_lib_instance():
+    global _lib_instance
 
+    if _lib_instance is None:
+        _lib_instance = _check_version(_attach_signatures(load_vimba_lib('VimbaImageTransform')))
 
-_lib_instance = _check_version(_attach_signatures(load_vimba_lib('VimbaImageTransform')))
+    return _lib_instance
 
 
 @TraceEnable()
@@ -406,10 +399,28 @@ def call_vimba_image_transform(func_name: str, *args):
         VmbImageTransform
     """
 
-    global _lib_instance
-    getattr(_lib_instance, func_name)(*args)
+    global _FUNCS
+
+    try:
+        func = _FUNCS[func_name]
+
+    except KeyError:
+        # Loads the library on first use. Unknown names raise an AttributeError, functions
+        # without declared signature are remembered as well.
+        func = getattr(_get_lib_instance(), func_name)
+        _FUNCS[func_name] = func
+
+    # VmbError.Success is 0 and functions without return value return None. Both are falsy,
+    # the common case costs a single truth test.
+    result = func(*args)
+
+    if result:
+        raise VimbaCError(VmbError(result))
 
 
+# Kept as a dict: pixel format values encode color, bits per pixel and an id across 32 bits
+# (e.g. Mono8 is 0x01080001), a table indexed by format value would span tens of millions of
+# entries for about 40 used ones. Lookups hash a single int, layout tuples are not rebuilt.
 PIXEL_FORMAT_TO_LAYOUT: Dict[VmbPixelFormat, Tuple[VmbPixelLayout, int]] = {
     VmbPixelFormat.Mono8: (VmbPixelLayout.Mono, 8),
     VmbPixelFormat.Mono10: (VmbPixelLayout.Mono, 16),
@@ -454,23 +465,60 @@ PIXEL_FORMAT_TO_LAYOUT: Dict[VmbPixelFormat, Tuple[VmbPixelLayout, int]] = {
     VmbPixelFormat.Bgra16: (VmbPixelLayout.BGRA, 16)
 }
 
-LAYOUT_TO_PIXEL_FORMAT = dict([(v, k) for k, v in PIXEL_FORMAT_TO_LAYOUT.items()])
+# Several pixel formats share a layout, e.g. Mono10 to Mono16 are all (Mono, 16). The format listed
+# last in PIXEL_FORMAT_TO_LAYOUT wins, mapping each layout to the format using all of its bits.
+LAYOUT_TO_PIXEL_FORMAT = {v: k for k, v in PIXEL_FORMAT_TO_LAYOUT.items()}
+
+_LAYOUT_TO_CHANNELS: Dict[VmbPixelLayout, int] = {
+    VmbPixelLayout.Mono: 1,
+    VmbPixelLayout.Raw: 1,
+    VmbPixelLayout.RGB: 3,
+    VmbPixelLayout.BGR: 3,
+    VmbPixelLayout.RGBA: 4,
+    VmbPixelLayout.BGRA: 4
+}
 
+# Channels per pixel are fixed for each format. Precomputing them saves querying
+# VimbaImageTransform each time an image buffer is interpreted.
+PIXEL_FORMAT_TO_CHANNELS: Dict[VmbPixelFormat, int] = {
+    fmt: _LAYOUT_TO_CHANNELS[layout] for fmt, (layout, _) in PIXEL_FORMAT_TO_LAYOUT.items()
+}
 
-def _query_compatibility(pixel_format: VmbPixelFormat) -> Tuple[VmbPixelFormat, ...]:
-    global LAYOUT_TO_PIXEL_FORMAT
 
-    # Query compatible formats from ImageTransform
-    output_pixel_layouts = (VmbPixelLayout.Mono, VmbPixelLayout.MonoPacked, VmbPixelLayout.Raw,
-                            VmbPixelLayout.RawPacked, VmbPixelLayout.RGB, VmbPixelLayout.BGR,
-                            VmbPixelLayout.RGBA, VmbPixelLayout.BGRA)
+# Output layouts probed for each source format by query_convertible_formats.
+_OUTPUT_LAYOUTS: Tuple[Tuple[VmbPixelLayout, int], ...] = tuple([
+    (layout, bits)
+    for layout in (VmbPixelLayout.Mono, VmbPixelLayout.MonoPacked, VmbPixelLayout.Raw,
+                   VmbPixelLayout.RawPacked, VmbPixelLayout.RGB, VmbPixelLayout.BGR,
+                   VmbPixelLayout.RGBA, VmbPixelLayout.BGRA)
+    for bits in (8, 16)
+])
+
+
+# Each query performs one VimbaImageTransform call per output layout. Results are cached per
+# format, formats are only queried when they are asked for.
+@functools.lru_cache(maxsize=None)
+def query_convertible_formats(pixel_format: VmbPixelFormat) -> Tuple[VmbPixelFormat, ...]:
+    """Query the formats VimbaImageTransform can convert the given format into.
+
+    Arguments:
+        pixel_format - Source format of the conversion.
+
+    Returns:
+        Tuple of all formats 'pixel_format' is convertible into.
 
-    output_bits_per_pixel = (8, 16)
-    output_layouts = tuple([(layouts, bits)
-                            for layouts in output_pixel_layouts
-                            for bits in output_bits_per_pixel])
+    Raises:
+        VimbaSystemError if VimbaImageTransform can't be loaded.
+        VimbaCError if a query fails for other reasons than an unsupported format.
+    """
+    global LAYOUT_TO_PIXEL_FORMAT
+    global _FUNCS
 
-    result: List[VmbPixelFormat] = []
+    # Query compatible formats from ImageTransform. The probing calls are issued on the bound
+    # function directly: routing each of them through call_vimba_image_transform would add
+    # tracing and a function lookup per probed layout. Formats are collected as dict keys,
+    # deduplicating them while keeping the probing order.
+    result: Dict[VmbPixelFormat, None] = {}
 
     src_image = VmbImage()
     src_image.Size = sizeof(src_image)
@@ -481,89 +529,72 @@ def _query_compatibility(pixel_format: VmbPixelFormat) -> Tuple[VmbPixelFormat,
     dst_image = VmbImage()
     dst_image.Size = sizeof(dst_image)
 
-    for layout, bits in output_layouts:
+    set_info_from_input_image = _FUNCS['VmbSetImageInfoFromInputImage']
+    src_ref = byref(src_image)
+    dst_ref = byref(dst_image)
 
-        try:
-            call_vimba_image_transform('VmbSetImageInfoFromInputImage', byref(src_image), layout,
-                                       bits, byref(dst_image))
+    for layout, bits in _OUTPUT_LAYOUTS:
+        err = set_info_from_input_image(src_ref, layout, bits, dst_ref)
 
-            fmt = LAYOUT_TO_PIXEL_FORMAT[(layout, bits)]
+        if err:
+            if err not in (VmbError.NotImplemented_, VmbError.BadParameter):
+                raise VimbaCError(VmbError(err))
 
-            if fmt not in result:
-                result.append(fmt)
+            continue
 
-        except VimbaCError as e:
-            if e.get_error_code() not in (VmbError.NotImplemented_, VmbError.BadParameter):
-                raise e
+        result[LAYOUT_TO_PIXEL_FORMAT[(layout, bits)]] = None
 
     return tuple(result)
 
 
-PIXEL_FORMAT_CONVERTIBILITY_MAP: Dict[VmbPixelFormat, Tuple[VmbPixelFormat, ...]] = {
-    VmbPixelFormat.Mono8: _query_compatibility(VmbPixelFormat.Mono8),
-    VmbPixelFormat.Mono10: _query_compatibility(VmbPixelFormat.Mono10),
-    VmbPixelFormat.Mono10p: _query_compatibility(VmbPixelFormat.Mono10p),
-    VmbPixelFormat.Mono12: _query_compatibility(VmbPixelFormat.Mono12),
-    VmbPixelFormat.Mono12Packed: _query_compatibility(VmbPixelFormat.Mono12Packed),
-    VmbPixelFormat.Mono12p: _query_compatibility(VmbPixelFormat.Mono12p),
-    VmbPixelFormat.Mono14: _query_compatibility(VmbPixelFormat.Mono14),
-    VmbPixelFormat.Mono16: _query_compatibility(VmbPixelFormat.Mono16),
-
-    VmbPixelFormat.BayerGR8: _query_compatibility(VmbPixelFormat.BayerGR8),
-    VmbPixelFormat.BayerRG8: _query_compatibility(VmbPixelFormat.BayerRG8),
-    VmbPixelFormat.BayerGB8: _query_compatibility(VmbPixelFormat.BayerGB8),
-    VmbPixelFormat.BayerBG8: _query_compatibility(VmbPixelFormat.BayerBG8),
-    VmbPixelFormat.BayerGR10: _query_compatibility(VmbPixelFormat.BayerGR10),
-    VmbPixelFormat.BayerRG10: _query_compatibility(VmbPixelFormat.BayerRG10),
-    VmbPixelFormat.BayerGB10: _query_compatibility(VmbPixelFormat.BayerGB10),
-    VmbPixelFormat.BayerBG10: _query_compatibility(VmbPixelFormat.BayerBG10),
-    VmbPixelFormat.BayerGR12: _query_compatibility(VmbPixelFormat.BayerGR12),
-    VmbPixelFormat.BayerRG12: _query_compatibility(VmbPixelFormat.BayerRG12),
-    VmbPixelFormat.BayerGB12: _query_compatibility(VmbPixelFormat.BayerGB12),
-    VmbPixelFormat.BayerBG12: _query_compatibility(VmbPixelFormat.BayerBG12),
-    VmbPixelFormat.BayerGR12Packed: _query_compatibility(VmbPixelFormat.BayerGR12Packed),
-    VmbPixelFormat.BayerRG12Packed: _query_compatibility(VmbPixelFormat.BayerRG12Packed),
-    VmbPixelFormat.BayerGB12Packed: _query_compatibility(VmbPixelFormat.BayerGB12Packed),
-    VmbPixelFormat.BayerBG12Packed: _query_compatibility(VmbPixelFormat.BayerBG12Packed),
-    VmbPixelFormat.BayerGR10p: _query_compatibility(VmbPixelFormat.BayerGR10p),
-    VmbPixelFormat.BayerRG10p: _query_compatibility(VmbPixelFormat.BayerRG10p),
-    VmbPixelFormat.BayerGB10p: _query_compatibility(VmbPixelFormat.BayerGB10p),
-    VmbPixelFormat.BayerBG10p: _query_compatibility(VmbPixelFormat.BayerBG10p),
-    VmbPixelFormat.BayerGR12p: _query_compatibility(VmbPixelFormat.BayerGR12p),
-    VmbPixelFormat.BayerRG12p: _query_compatibility(VmbPixelFormat.BayerRG12p),
-    VmbPixelFormat.BayerGB12p: _query_compatibility(VmbPixelFormat.BayerGB12p),
-    VmbPixelFormat.BayerBG12p: _query_compatibility(VmbPixelFormat.BayerBG12p),
-    VmbPixelFormat.BayerGR16: _query_compatibility(VmbPixelFormat.BayerGR16),
-    VmbPixelFormat.BayerRG16: _query_compatibility(VmbPixelFormat.BayerRG16),
-    VmbPixelFormat.BayerGB16: _query_compatibility(VmbPixelFormat.BayerGB16),
-    VmbPixelFormat.BayerBG16: _query_compatibility(VmbPixelFormat.BayerBG16),
-
-    VmbPixelFormat.Rgb8: _query_compatibility(VmbPixelFormat.Rgb8),
-    VmbPixelFormat.Bgr8: _query_compatibility(VmbPixelFormat.Bgr8),
-    VmbPixelFormat.Rgb10: _query_compatibility(VmbPixelFormat.Rgb10),
-    VmbPixelFormat.Bgr10: _query_compatibility(VmbPixelFormat.Bgr10),
-    VmbPixelFormat.Rgb12: _query_compatibility(VmbPixelFormat.Rgb12),
-    VmbPixelFormat.Bgr12: _query_compatibility(VmbPixelFormat.Bgr12),
-    VmbPixelFormat.Rgb14: _query_compatibility(VmbPixelFormat.Rgb14),
-    VmbPixelFormat.Bgr14: _query_compatibility(VmbPixelFormat.Bgr14),
-    VmbPixelFormat.Rgb16: _query_compatibility(VmbPixelFormat.Rgb16),
-    VmbPixelFormat.Bgr16: _query_compatibility(VmbPixelFormat.Bgr16),
-    VmbPixelFormat.Argb8: _query_compatibility(VmbPixelFormat.Argb8),
-    VmbPixelFormat.Rgba8: _query_compatibility(VmbPixelFormat.Rgba8),
-    VmbPixelFormat.Bgra8: _query_compatibility(VmbPixelFormat.Bgra8),
-    VmbPixelFormat.Rgba10: _query_compatibility(VmbPixelFormat.Rgba10),
-    VmbPixelFormat.Bgra10: _query_compatibility(VmbPixelFormat.Bgra10),
-    VmbPixelFormat.Rgba12: _query_compatibility(VmbPixelFormat.Rgba12),
-    VmbPixelFormat.Bgra12: _query_compatibility(VmbPixelFormat.Bgra12),
-    VmbPixelFormat.Rgba14: _query_compatibility(VmbPixelFormat.Rgba14),
-    VmbPixelFormat.Bgra14: _query_compatibility(VmbPixelFormat.Bgra14),
-    VmbPixelFormat.Rgba16: _query_compatibility(VmbPixelFormat.Rgba16),
-    VmbPixelFormat.Bgra16: _query_compatibility(VmbPixelFormat.Bgra16),
-
-    VmbPixelFormat.Yuv411: _query_compatibility(VmbPixelFormat.Yuv411),
-    VmbPixelFormat.Yuv422: _query_compatibility(VmbPixelFormat.Yuv422),
-    VmbPixelFormat.Yuv444: _query_compatibility(VmbPixelFormat.Yuv444),
-    VmbPixelFormat.YCbCr411_8_CbYYCrYY: _query_compatibility(VmbPixelFormat.YCbCr411_8_CbYYCrYY),
-    VmbPixelFormat.YCbCr422_8_CbYCrY: _query_compatibility(VmbPixelFormat.YCbCr422_8_CbYCrY),
-    VmbPixelFormat.YCbCr8_CbYCr: _query_compatibility(VmbPixelFormat.YCbCr8_CbYCr)
-}
+# Bare annotation only: the map is built on first access via the module __getattr__.
+PIXEL_FORMAT_CONVERTIBILITY_MAP: Dict[VmbPixelFormat, Tuple[VmbPixelFormat, ...]]
+
+
+# Source formats listed in PIXEL_FORMAT_CONVERTIBILITY_MAP. They are queried sequentially: each
+# query is a few short VimbaImageTransform calls, a thread pool would cost more than it saves.
+_CONVERTIBLE_SOURCE_FORMATS: Tuple[VmbPixelFormat, ...] = (
+    VmbPixelFormat.Mono8, VmbPixelFormat.Mono10, VmbPixelFormat.Mono10p, VmbPixelFormat.Mono12,
+    VmbPixelFormat.Mono12Packed, VmbPixelFormat.Mono12p, VmbPixelFormat.Mono14,
+    VmbPixelFormat.Mono16,
+
+    VmbPixelFormat.BayerGR8, VmbPixelFormat.BayerRG8, VmbPixelFormat.BayerGB8,
+    VmbPixelFormat.BayerBG8, VmbPixelFormat.BayerGR10, VmbPixelFormat.BayerRG10,
+    VmbPixelFormat.BayerGB10, VmbPixelFormat.BayerBG10, VmbPixelFormat.BayerGR12,
+    VmbPixelFormat.BayerRG12, VmbPixelFormat.BayerGB12, VmbPixelFormat.BayerBG12,
+    VmbPixelFormat.BayerGR12Packed, VmbPixelFormat.BayerRG12Packed, VmbPixelFormat.BayerGB12Packed,
+    VmbPixelFormat.BayerBG12Packed, VmbPixelFormat.BayerGR10p, VmbPixelFormat.BayerRG10p,
+    VmbPixelFormat.BayerGB10p, VmbPixelFormat.BayerBG10p, VmbPixelFormat.BayerGR12p,
+    VmbPixelFormat.BayerRG12p, VmbPixelFormat.BayerGB12p, VmbPixelFormat.BayerBG12p,
+    VmbPixelFormat.BayerGR16, VmbPixelFormat.BayerRG16, VmbPixelFormat.BayerGB16,
+    VmbPixelFormat.BayerBG16,
+
+    VmbPixelFormat.Rgb8, VmbPixelFormat.Bgr8, VmbPixelFormat.Rgb10, VmbPixelFormat.Bgr10,
+    VmbPixelFormat.Rgb12, VmbPixelFormat.Bgr12, VmbPixelFormat.Rgb14, VmbPixelFormat.Bgr14,
+    VmbPixelFormat.Rgb16, VmbPixelFormat.Bgr16, VmbPixelFormat.Argb8, VmbPixelFormat.Rgba8,
+    VmbPixelFormat.Bgra8, VmbPixelFormat.Rgba10, VmbPixelFormat.Bgra10, VmbPixelFormat.Rgba12,
+    VmbPixelFormat.Bgra12, VmbPixelFormat.Rgba14, VmbPixelFormat.Bgra14, VmbPixelFormat.Rgba16,
+    VmbPixelFormat.Bgra16,
+
+    VmbPixelFormat.Yuv411, VmbPixelFormat.Yuv422, VmbPixelFormat.Yuv444,
+    VmbPixelFormat.YCbCr411_8_CbYYCrYY, VmbPixelFormat.YCbCr422_8_CbYCrY,
+    VmbPixelFormat.YCbCr8_CbYCr
+)
+
+
+def _build_convertibility_map() -> Dict[VmbPixelFormat, Tuple[VmbPixelFormat, ...]]:
+    return {fmt: query_convertible_formats(fmt) for fmt in _CONVERTIBLE_SOURCE_FORMATS}
+
+
+def __getattr__(name: str):
+    # Module level attributes depending on the loaded VimbaImageTransform library are
+    # resolved on first access and cached within the module namespace afterwards.
+    if name == 'VIMBA_IMAGE_TRANSFORM_VERSION':
+        _get_lib_instance()
+        return globals()[name]
+
+    if name == 'PIXEL_FORMAT_CONVERTIBILITY_MAP':
+        globals()[name] = _build_convertibility_map()
+        return globals()[name]
+
+    raise AttributeError('module {} has no attribute {}'.format(__name__, name))
@@ -30,18 +30,20 @@ import os
 import copy
 import threading
 
-from ctypes import POINTER
+from ctypes import POINTER, byref, sizeof
 from typing import Tuple, List, Callable, cast, Optional, Union, Dict
-from .c_binding import call_vimba_c, build_callback_type, byref, sizeof, decode_cstr, decode_flags
+from .c_binding import call_vimba_c, build_vimba_c_call, build_callback_type, decode_cstr, \
+                       decode_flags
 from .c_binding import VmbCameraInfo, VmbHandle, VmbUint32, G_VIMBA_C_HANDLE, VmbAccessMode, \
-                       VimbaCError, VmbError, VmbFrame, VmbFeaturePersist, VmbFeaturePersistSettings
+                       VimbaCError, VmbError, VmbFrame, VmbFeaturePersist, \
+                       VmbFeaturePersistSettings, SIZEOF_VMB_FRAME
 from .feature import discover_features, discover_feature, FeatureTypes, FeaturesTuple, \
                      FeatureTypeTypes
-from .shared import filter_features_by_name, filter_features_by_type, filter_affected_features, \
+from .shared import filter_features_by_type, filter_affected_features, \
                     filter_selected_features, filter_features_by_category, \
                     attach_feature_accessors, remove_feature_accessors, read_memory, \
                     write_memory, read_registers, write_registers
-from .frame import Frame, FormatTuple, PixelFormat, AllocationMode
+from .frame import Frame, FormatTuple, PixelFormat, AllocationMode, _allocate_frames
 from .util import Log, TraceEnable, RuntimeTypeCheckEnable, EnterContextOnCall, \
                   LeaveContextOnCall, RaiseIfInsideContext, RaiseIfOutsideContext
 from .error import VimbaSystemError, VimbaCameraError, VimbaTimeout, VimbaFeatureError
@@ -68,6 +70,14 @@ CamerasList = List['Camera']
 FrameHandler = Callable[['Camera', Frame], None]
 
 
+# PixelFormat member names and the entries of the 'PixelFormat' feature differ in case only.
+# Names are uppercased once, in member order. Aliases keep their own key, so lookups behave
+# exactly like scanning PixelFormat.__members__.
+_PIXEL_FORMATS_BY_UPPER_NAME: Dict[str, PixelFormat] = {
+    name.upper(): fmt for name, fmt in PixelFormat.__members__.items()
+}
+
+
 class AccessMode(enum.IntEnum):
     """Enum specifying all available camera access modes.
 
@@ -117,9 +127,22 @@ class _Context:
         self.cam_handle = _cam_handle_accessor(cam)
         self.frames = frames
         self.frames_lock = threading.Lock()
+
+        # VmbFrame structures and references to them are fixed for the capture session, build
+        # them once instead of for each announce, queue, wait and revoke.
+        self.frame_handles = tuple([_frame_handle_accessor(frame) for frame in frames])
+        self.frame_refs = tuple([byref(frame_handle) for frame_handle in self.frame_handles])
+
+        # Frames queued by the user are validated by identity. The context holds all frames,
+        # their ids stay valid for the session.
+        self.frame_ids = frozenset([id(frame) for frame in frames])
         self.frames_handler = handler
         self.frames_callback = callback
 
+        # Functions called for each frame are resolved once per capture session.
+        self.frame_queue = build_vimba_c_call('VmbCaptureFrameQueue')
+        self.frame_wait = build_vimba_c_call('VmbCaptureFrameWait')
+
 
 class _State:
     def __init__(self, context: _Context):
@@ -129,20 +152,20 @@ class _State:
 class _StateInit(_State):
     @TraceEnable()
     def forward(self) -> Union[_State, VimbaCameraError]:
-        for frame in self.context.frames:
-            frame_handle = _frame_handle_accessor(frame)
+        context = self.context
 
+        for frame, frame_handle, frame_ref in zip(context.frames, context.frame_handles,
+                                                  context.frame_refs):
             try:
-                call_vimba_c('VmbFrameAnnounce', self.context.cam_handle, byref(frame_handle),
-                             sizeof(frame_handle))
+                call_vimba_c('VmbFrameAnnounce', context.cam_handle, frame_ref, SIZEOF_VMB_FRAME)
                 if frame._allocation_mode == AllocationMode.AllocAndAnnounceFrame:
                     assert frame_handle.buffer is not None
                     frame._set_buffer(frame_handle.buffer)
 
             except VimbaCError as e:
-                return _build_camera_error(self.context.cam, e)
+                return _build_camera_error(context.cam, e)
 
-        return _StateAnnounced(self.context)
+        return _StateAnnounced(context)
 
 
 class _StateAnnounced(_State):
@@ -158,11 +181,9 @@ class _StateAnnounced(_State):
 
     @TraceEnable()
     def backward(self) -> Union[_State, VimbaCameraError]:
-        for frame in self.context.frames:
-            frame_handle = _frame_handle_accessor(frame)
-
+        for frame_ref in self.context.frame_refs:
             try:
-                call_vimba_c('VmbFrameRevoke', self.context.cam_handle, byref(frame_handle))
+                call_vimba_c('VmbFrameRevoke', self.context.cam_handle, frame_ref)
 
             except VimbaCError as e:
                 return _build_camera_error(self.context.cam, e)
@@ -195,6 +216,11 @@ class _StateCapturing(_State):
 
 
 class _StateNotAcquiring(_State):
+    @TraceEnable()
+    def forward(self) -> Union[_State, VimbaCameraError]:
+        # Restart acquisition on the running capture engine, frames stay announced.
+        return _StateCapturing(self.context).forward()
+
     @TraceEnable()
     def backward(self) -> Union[_State, VimbaCameraError]:
         try:
@@ -222,15 +248,14 @@ class _StateAcquiring(_State):
 
     @TraceEnable()
     def wait_for_frames(self, timeout_ms: int):
-        for frame in self.context.frames:
-            self.queue_frame(frame)
+        self.queue_all_frames()
 
-        for frame in self.context.frames:
-            frame_handle = _frame_handle_accessor(frame)
+        frame_wait = self.context.frame_wait
+        cam_handle = self.context.cam_handle
 
+        for frame_ref in self.context.frame_refs:
             try:
-                call_vimba_c('VmbCaptureFrameWait', self.context.cam_handle, byref(frame_handle),
-                             timeout_ms)
+                frame_wait(cam_handle, frame_ref, timeout_ms)
 
             except VimbaCError as e:
                 raise _build_camera_error(self.context.cam, e) from e
@@ -240,8 +265,23 @@ class _StateAcquiring(_State):
         frame_handle = _frame_handle_accessor(frame)
 
         try:
-            call_vimba_c('VmbCaptureFrameQueue', self.context.cam_handle, byref(frame_handle),
-                         self.context.frames_callback)
+            self.context.frame_queue(self.context.cam_handle, byref(frame_handle),
+                                     self.context.frames_callback)
+
+        except VimbaCError as e:
+            raise _build_camera_error(self.context.cam, e) from e
+
+    @TraceEnable()
+    def queue_all_frames(self):
+        # Queue all frames within a single traced call, the queue function and its common
+        # arguments are looked up once for the whole batch.
+        frame_queue = self.context.frame_queue
+        cam_handle = self.context.cam_handle
+        callback = self.context.frames_callback
+
+        try:
+            for frame_ref in self.context.frame_refs:
+                frame_queue(cam_handle, frame_ref, callback)
 
         except VimbaCError as e:
             raise _build_camera_error(self.context.cam, e) from e
@@ -260,12 +300,15 @@ class _CaptureFsm:
         exc = None
 
         while not exc:
-            try:
-                state_or_exc = self.__state.forward()
+            # States without further transition in this direction end the traversal. Checked
+            # explicitly, an AttributeError raised within a transition must not be swallowed.
+            transition = getattr(self.__state, 'forward', None)
 
-            except AttributeError:
+            if transition is None:
                 break
 
+            state_or_exc = transition()
+
             if isinstance(state_or_exc, _State):
                 self.__state = state_or_exc
 
@@ -279,12 +322,13 @@ class _CaptureFsm:
         exc = None
 
         while not exc:
-            try:
-                state_or_exc = self.__state.backward()
+            transition = getattr(self.__state, 'backward', None)
 
-            except AttributeError:
+            if transition is None:
                 break
 
+            state_or_exc = transition()
+
             if isinstance(state_or_exc, _State):
                 self.__state = state_or_exc
 
@@ -293,6 +337,20 @@ class _CaptureFsm:
 
         return exc
 
+    def stop_acquisition(self):
+        # Revert a single step to stop acquiring while keeping the capture engine running.
+        # A following enter_capturing_mode() restarts acquisition from there.
+        if isinstance(self.__state, _StateAcquiring):
+            state_or_exc = self.__state.backward()
+
+            if isinstance(state_or_exc, _State):
+                self.__state = state_or_exc
+
+            else:
+                return state_or_exc
+
+        return None
+
     def wait_for_frames(self, timeout_ms: int):
         # Wait for Frames only in AcquiringMode
         if isinstance(self.__state, _StateAcquiring):
@@ -303,6 +361,11 @@ class _CaptureFsm:
         if isinstance(self.__state, _StateAcquiring):
             self.__state.queue_frame(frame)
 
+    def queue_all_frames(self):
+        # Queue Frames only in AcquiringMode
+        if isinstance(self.__state, _StateAcquiring):
+            self.__state.queue_all_frames()
+
 
 @TraceEnable()
 def _frame_generator(cam, limit: Optional[int], timeout_ms: int, allocation_mode: AllocationMode):
@@ -316,16 +379,32 @@ def _frame_generator(cam, limit: Optional[int], timeout_ms: int, allocation_mode
 
     try:
         while True if limit is None else cnt < limit:
-            # Enter Capturing mode
+            # Enter Capturing mode. After the first iteration, only acquisition is restarted.
             exc = fsm.enter_capturing_mode()
             if exc:
                 raise exc
 
             fsm.wait_for_frames(timeout_ms)
 
-            # Return copy of internally used frame to keep them independent.
+            # Return copy of internally used frame to keep them independent. The copy is owned
+            # by the caller and can't be recycled, only frames[0] is reused across iterations.
             frame_copy = copy.deepcopy(frames[0])
-            fsm.leave_capturing_mode()
+
+            # The camera must not acquire while the caller holds the frame. Before the last
+            # frame, capturing mode is left completely: the caller may never resume the generator
+            # and teardown must not be deferred to garbage collection. Otherwise only acquisition
+            # is stopped, the frame stays announced and the capture engine running, saving
+            # announce, start, end, flush and revoke for each further frame.
+            if limit is not None and cnt + 1 == limit:
+                exc = fsm.leave_capturing_mode()
+                if exc:
+                    raise exc
+
+            else:
+                exc = fsm.stop_acquisition()
+                if exc:
+                    raise exc
+
             frame_copy._frame.frameID = cnt
             cnt += 1
 
@@ -352,6 +431,7 @@ class Camera:
         self.__info: VmbCameraInfo = info
         self.__access_mode: AccessMode = AccessMode.Full
         self.__feats: FeaturesTuple = ()
+        self.__feats_by_name: Dict[str, FeatureTypes] = {}
         self.__context_cnt: int = 0
         self.__capture_fsm: Optional[_CaptureFsm] = None
         self._disconnected = False
@@ -606,9 +686,9 @@ class Camera:
             RuntimeError if called outside "with" - statement scope.
             VimbaFeatureError if no feature is associated with 'feat_name'.
         """
-        feat = filter_features_by_name(self.__feats, feat_name)
+        feat = self.__feats_by_name.get(feat_name)
 
-        if not feat:
+        if feat is None:
             raise VimbaFeatureError('Feature \'{}\' not found.'.format(feat_name))
 
         return feat
@@ -622,7 +702,9 @@ class Camera:
                             allocation_mode: AllocationMode = AllocationMode.AnnounceFrame):
         """Construct frame generator, providing synchronous image acquisition.
 
-        The Frame generator acquires a new frame with each execution.
+        The Frame generator acquires a new frame with each execution. Acquisition is stopped
+        between executions, the frame buffer stays announced until the last frame of a limited
+        generator is returned or the generator is closed.
 
         Arguments:
             limit - The number of images the generator shall acquire. If limit is None,
@@ -672,7 +754,13 @@ class Camera:
             ValueError if a timeout_ms is negative.
             VimbaTimeout if Frame acquisition timed out.
         """
-        return next(self.get_frame_generator(1, timeout_ms, allocation_mode))
+        gen = self.get_frame_generator(1, timeout_ms, allocation_mode)
+
+        try:
+            return next(gen)
+
+        finally:
+            gen.close()
 
     @TraceEnable()
     @RaiseIfOutsideContext()
@@ -706,9 +794,10 @@ class Camera:
         if self.is_streaming():
             raise VimbaCameraError('Camera \'{}\' already streaming.'.format(self.get_id()))
 
-        # Setup capturing fsm
+        # Setup capturing fsm. The frames below form the buffer pool for the whole streaming
+        # session: after each callback they are queued again instead of being reallocated.
         payload_size = self.get_feature_by_name('PayloadSize').get()
-        frames = tuple([Frame(payload_size, allocation_mode) for _ in range(buffer_count)])
+        frames = _allocate_frames(payload_size, buffer_count, allocation_mode)
         callback = build_callback_type(None, VmbHandle, POINTER(VmbFrame))(self.__frame_cb_wrapper)
 
         self.__capture_fsm = _CaptureFsm(_Context(self, frames, handler, callback))
@@ -721,8 +810,7 @@ class Camera:
             raise exc
 
         else:
-            for frame in frames:
-                self.__capture_fsm.queue_frame(frame)
+            self.__capture_fsm.queue_all_frames()
 
     @TraceEnable()
     @RaiseIfOutsideContext()
@@ -775,7 +863,7 @@ class Camera:
         if self.__capture_fsm is None:
             return
 
-        if frame not in self.__capture_fsm.get_context().frames:
+        if id(frame) not in self.__capture_fsm.get_context().frame_ids:
             raise ValueError('Given Frame is not from Queue')
 
         self.__capture_fsm.queue_frame(frame)
@@ -791,21 +879,15 @@ class Camera:
         Raises:
             RuntimeError if called outside "with" - statement scope.
         """
-        result = []
         feat = self.get_feature_by_name('PixelFormat')
 
         # Build intersection between PixelFormat Enum Values and PixelFormat
         # Note: The Mapping is a bit complicated due to different writing styles within
         #       Feature EnumEntries and PixelFormats
-        all_fmts = set([k.upper() for k in PixelFormat.__members__])
         all_enum_fmts = set([str(k).upper() for k in feat.get_available_entries()])
-        fmts = all_fmts.intersection(all_enum_fmts)
-
-        for k in PixelFormat.__members__:
-            if k.upper() in fmts:
-                result.append(PixelFormat[k])
 
-        return tuple(result)
+        return tuple([fmt for name, fmt in _PIXEL_FORMATS_BY_UPPER_NAME.items()
+                      if name in all_enum_fmts])
 
     @TraceEnable()
     @RaiseIfOutsideContext()
@@ -817,9 +899,7 @@ class Camera:
         """
         enum_value = str(self.get_feature_by_name('PixelFormat').get()).upper()
 
-        for k in PixelFormat.__members__:
-            if k.upper() == enum_value:
-                return PixelFormat[k]
+        return _PIXEL_FORMATS_BY_UPPER_NAME.get(enum_value)
 
     @TraceEnable()
     @RaiseIfOutsideContext()
@@ -835,15 +915,16 @@ class Camera:
             RuntimeError if called outside "with" - statement scope.
             ValueError if the given pixel format is not supported by the cameras.
         """
-        if fmt not in self.get_pixel_formats():
-            raise ValueError('Camera does not support PixelFormat \'{}\''.format(str(fmt)))
-
         feat = self.get_feature_by_name('PixelFormat')
-        fmt_str = str(fmt).upper()
 
-        for entry in feat.get_available_entries():
-            if str(entry).upper() == fmt_str:
-                feat.set(entry)
+        # Validate and select the matching entry within a single pass over the available entries
+        entries = {str(entry).upper(): entry for entry in feat.get_available_entries()}
+        entry = entries.get(str(fmt).upper())
+
+        if entry is None:
+            raise ValueError('Camera does not support PixelFormat \'{}\''.format(str(fmt)))
+
+        feat.set(entry)
 
     @TraceEnable()
     @RaiseIfOutsideContext()
@@ -865,8 +946,7 @@ class Camera:
         if not file.endswith('.xml'):
             raise ValueError('Given file \'{}\' must end with \'.xml\''.format(file))
 
-        settings = VmbFeaturePersistSettings()
-        settings.persistType = VmbFeaturePersist(persist_type)
+        settings = VmbFeaturePersistSettings(persistType=VmbFeaturePersist(persist_type))
 
         call_vimba_c('VmbCameraSettingsSave', self.__handle, file.encode('utf-8'), byref(settings),
                      sizeof(settings))
@@ -894,8 +974,7 @@ class Camera:
         if not os.path.exists(file):
             raise ValueError('Given file \'{}\' does not exist.'.format(file))
 
-        settings = VmbFeaturePersistSettings()
-        settings.persistType = VmbFeaturePersist(persist_type)
+        settings = VmbFeaturePersistSettings(persistType=VmbFeaturePersist(persist_type))
 
         call_vimba_c('VmbCameraSettingsLoad', self.__handle, file.encode('utf-8'), byref(settings),
                      sizeof(settings))
@@ -926,8 +1005,12 @@ class Camera:
         self.__feats = discover_features(self.__handle)
         attach_feature_accessors(self, self.__feats)
 
+        # Features are looked up by name on every stream start and stop (PayloadSize,
+        # AcquisitionStart, AcquisitionStop) and for pixel format access. Index them once.
+        self.__feats_by_name = {feat.get_name(): feat for feat in self.__feats}
+
         # Determine current PacketSize (GigE - only) is somewhere between 1500 bytes
-        feat = filter_features_by_name(self.__feats, 'GVSPPacketSize')
+        feat = self.__feats_by_name.get('GVSPPacketSize')
         if feat:
             try:
                 min_ = 1400
@@ -953,6 +1036,7 @@ class Camera:
 
         remove_feature_accessors(self, self.__feats)
         self.__feats = ()
+        self.__feats_by_name = {}
 
         call_vimba_c('VmbCameraClose', self.__handle)
         self.__handle = VmbHandle(0)
@@ -970,9 +1054,9 @@ class Camera:
             raw_frame = raw_frame_ptr.contents
             frame = None
 
-            for f in context.frames:
+            for f, frame_handle in zip(context.frames, context.frame_handles):
                 # Access Frame internals to compare if both point to the same buffer
-                if raw_frame.buffer == _frame_handle_accessor(f).buffer:
+                if raw_frame.buffer == frame_handle.buffer:
                     frame = f
                     break
 
@@ -30,9 +30,10 @@ import enum
 import ctypes
 import threading
 
-from typing import Tuple, Union, List, Callable, Optional, cast, Type
-from .c_binding import call_vimba_c, byref, sizeof, create_string_buffer, decode_cstr, \
-                       decode_flags, build_callback_type
+from ctypes import byref, sizeof, create_string_buffer
+from typing import Tuple, Union, List, Callable, Optional, cast, Type, Dict
+from .c_binding import call_vimba_c, decode_cstr, decode_flags, build_callback_type, \
+                       SIZEOF_VMB_FEATURE_INFO, SIZEOF_VMB_FEATURE_ENUM_ENTRY
 from .c_binding import VmbFeatureInfo, VmbFeatureFlags, VmbUint32, VmbInt64, VmbHandle, \
                        VmbFeatureVisibility, VmbBool, VmbFeatureEnumEntry, VmbFeatureData, \
                        VmbError, VimbaCError, VmbDouble
@@ -101,6 +102,43 @@ class FeatureVisibility(enum.IntEnum):
     Invisible = VmbFeatureVisibility.Invisible
 
 
+# Values of String- and RawFeatures are read into a buffer kept per thread. It is only
+# reallocated if a larger value is read, avoiding an allocation for each read of polled features.
+# Values larger than _SCRATCH_BUFFER_MAX_SIZE get a buffer of their own, a single large read must
+# not pin memory for the lifetime of the thread.
+# Scalar out-parameters are kept per thread and ctypes type for the same reason.
+_scratch = threading.local()
+_SCRATCH_BUFFER_MAX_SIZE = 64 * 1024
+
+
+def _get_scratch_buffer(size: int) -> ctypes.Array:
+    if size > _SCRATCH_BUFFER_MAX_SIZE:
+        return create_string_buffer(size)
+
+    buf = getattr(_scratch, 'buf', None)
+
+    if (buf is None) or (sizeof(buf) < size):
+        buf = create_string_buffer(size)
+        _scratch.buf = buf
+
+    return buf
+
+
+def _get_scratch_value(c_type):
+    values = getattr(_scratch, 'values', None)
+
+    if values is None:
+        values = {}
+        _scratch.values = values
+
+    try:
+        return values[c_type]
+
+    except KeyError:
+        c_val = values[c_type] = c_type()
+        return c_val
+
+
 class _BaseFeature:
     """This class provides most basic feature access functionality.
     All FeatureType implementations must derive from BaseFeature.
@@ -111,6 +149,10 @@ class _BaseFeature:
         self._handle: VmbHandle = handle
         self._info: VmbFeatureInfo = info
 
+        # The name is passed to VimbaC on every access. Reading the c_char_p field creates a new
+        # bytes object each time, the name is read once instead.
+        self._name: bytes = info.name
+
         self.__handlers: List[ChangeHandler] = []
         self.__handlers_lock = threading.Lock()
 
@@ -126,7 +168,7 @@ class _BaseFeature:
 
     def get_name(self) -> str:
         """Get Feature Name, e.g. DiscoveryInterfaceEvent"""
-        return decode_cstr(self._info.name)
+        return decode_cstr(self._name)
 
     def get_type(self) -> Type['_BaseFeature']:
         """Get Feature Type, e.g. IntFeature"""
@@ -201,7 +243,7 @@ class _BaseFeature:
         c_read = VmbBool(False)
         c_write = VmbBool(False)
 
-        call_vimba_c('VmbFeatureAccessQuery', self._handle, self._info.name, byref(c_read),
+        call_vimba_c('VmbFeatureAccessQuery', self._handle, self._name, byref(c_read),
                      byref(c_write))
 
         return (c_read.value, c_write.value)
@@ -285,12 +327,12 @@ class _BaseFeature:
 
     @TraceEnable()
     def __register_callback(self):
-        call_vimba_c('VmbFeatureInvalidationRegister', self._handle, self._info.name,
+        call_vimba_c('VmbFeatureInvalidationRegister', self._handle, self._name,
                      self.__feature_callback, None)
 
     @TraceEnable()
     def __unregister_callback(self):
-        call_vimba_c('VmbFeatureInvalidationUnregister', self._handle, self._info.name,
+        call_vimba_c('VmbFeatureInvalidationUnregister', self._handle, self._name,
                      self.__feature_callback)
 
     def __feature_cb_wrapper(self, *_):   # coverage: skip
@@ -355,10 +397,10 @@ class BoolFeature(_BaseFeature):
         Raises:
             VimbaFeatureError if access rights are not sufficient.
         """
-        c_val = VmbBool(False)
+        c_val = _get_scratch_value(VmbBool)
 
         try:
-            call_vimba_c('VmbFeatureBoolGet', self._handle, self._info.name, byref(c_val))
+            call_vimba_c('VmbFeatureBoolGet', self._handle, self._name, byref(c_val))
 
         except VimbaCError as e:
             err = e.get_error_code()
@@ -387,7 +429,7 @@ class BoolFeature(_BaseFeature):
         as_bool = bool(val)
 
         try:
-            call_vimba_c('VmbFeatureBoolSet', self._handle, self._info.name, as_bool)
+            call_vimba_c('VmbFeatureBoolSet', self._handle, self._name, as_bool)
 
         except VimbaCError as e:
             err = e.get_error_code()
@@ -434,7 +476,7 @@ class CommandFeature(_BaseFeature):
             VimbaFeatureError if access rights are not sufficient.
         """
         try:
-            call_vimba_c('VmbFeatureCommandRun', self._handle, self._info.name)
+            call_vimba_c('VmbFeatureCommandRun', self._handle, self._name)
 
         except VimbaCError as e:
             exc = cast(VimbaFeatureError, e)
@@ -457,10 +499,10 @@ class CommandFeature(_BaseFeature):
         Raises:
             VimbaFeatureError if access rights are not sufficient.
         """
-        c_val = VmbBool(False)
+        c_val = _get_scratch_value(VmbBool)
 
         try:
-            call_vimba_c('VmbFeatureCommandIsDone', self._handle, self._info.name, byref(c_val))
+            call_vimba_c('VmbFeatureCommandIsDone', self._handle, self._name, byref(c_val))
 
         except VimbaCError as e:
             if e.get_error_code() == VmbError.InvalidAccess:
@@ -509,7 +551,7 @@ class EnumEntry:
             True if the EnumEntry can be used as a value, otherwise False.
         """
 
-        c_val = VmbBool(False)
+        c_val = _get_scratch_value(VmbBool)
 
         call_vimba_c('VmbFeatureEnumIsAvailable', self.__handle, self.__feat_name, self.__info.name,
                      byref(c_val))
@@ -530,7 +572,7 @@ class EnumFeature(_BaseFeature):
         """Do not call directly. Instead, access Features via System, Camera, or Interface Types."""
         super().__init__(handle, info)
 
-        self.__entries: EnumEntryTuple = _discover_enum_entries(self._handle, self._info.name)
+        self.__entries: EnumEntryTuple = _discover_enum_entries(self._handle, self._name)
 
     def __str__(self):
         try:
@@ -581,7 +623,7 @@ class EnumFeature(_BaseFeature):
         c_val = ctypes.c_char_p(None)
 
         try:
-            call_vimba_c('VmbFeatureEnumGet', self._handle, self._info.name, byref(c_val))
+            call_vimba_c('VmbFeatureEnumGet', self._handle, self._name, byref(c_val))
 
         except VimbaCError as e:
             if e.get_error_code() == VmbError.InvalidAccess:
@@ -613,7 +655,7 @@ class EnumFeature(_BaseFeature):
             as_entry = self.get_entry(int(val))
 
         try:
-            call_vimba_c('VmbFeatureEnumSet', self._handle, self._info.name, bytes(as_entry))
+            call_vimba_c('VmbFeatureEnumSet', self._handle, self._name, bytes(as_entry))
 
         except VimbaCError as e:
             err = e.get_error_code()
@@ -648,7 +690,7 @@ def _discover_enum_entries(handle: VmbHandle, feat_name: str) -> EnumEntryTuple:
             enum_info = VmbFeatureEnumEntry()
 
             call_vimba_c('VmbFeatureEnumEntryGet', handle, feat_name, enum_name, byref(enum_info),
-                         sizeof(VmbFeatureEnumEntry))
+                         SIZEOF_VMB_FEATURE_ENUM_ENTRY)
 
             result.append(EnumEntry(handle, feat_name, enum_info))
 
@@ -681,10 +723,10 @@ class FloatFeature(_BaseFeature):
         Raises:
             VimbaFeatureError if access rights are not sufficient.
         """
-        c_val = VmbDouble(0.0)
+        c_val = _get_scratch_value(VmbDouble)
 
         try:
-            call_vimba_c('VmbFeatureFloatGet', self._handle, self._info.name, byref(c_val))
+            call_vimba_c('VmbFeatureFloatGet', self._handle, self._name, byref(c_val))
 
         except VimbaCError as e:
             if e.get_error_code() == VmbError.InvalidAccess:
@@ -711,7 +753,7 @@ class FloatFeature(_BaseFeature):
         c_max = VmbDouble(0.0)
 
         try:
-            call_vimba_c('VmbFeatureFloatRangeQuery', self._handle, self._info.name, byref(c_min),
+            call_vimba_c('VmbFeatureFloatRangeQuery', self._handle, self._name, byref(c_min),
                          byref(c_max))
 
         except VimbaCError as e:
@@ -739,7 +781,7 @@ class FloatFeature(_BaseFeature):
         c_val = VmbDouble(False)
 
         try:
-            call_vimba_c('VmbFeatureFloatIncrementQuery', self._handle, self._info.name,
+            call_vimba_c('VmbFeatureFloatIncrementQuery', self._handle, self._name,
                          byref(c_has_val), byref(c_val))
 
         except VimbaCError as e:
@@ -768,7 +810,7 @@ class FloatFeature(_BaseFeature):
         as_float = float(val)
 
         try:
-            call_vimba_c('VmbFeatureFloatSet', self._handle, self._info.name, as_float)
+            call_vimba_c('VmbFeatureFloatSet', self._handle, self._name, as_float)
 
         except VimbaCError as e:
             err = e.get_error_code()
@@ -824,10 +866,10 @@ class IntFeature(_BaseFeature):
         Raises:
             VimbaFeatureError if access rights are not sufficient.
         """
-        c_val = VmbInt64()
+        c_val = _get_scratch_value(VmbInt64)
 
         try:
-            call_vimba_c('VmbFeatureIntGet', self._handle, self._info.name, byref(c_val))
+            call_vimba_c('VmbFeatureIntGet', self._handle, self._name, byref(c_val))
 
         except VimbaCError as e:
             if e.get_error_code() == VmbError.InvalidAccess:
@@ -854,7 +896,7 @@ class IntFeature(_BaseFeature):
         c_max = VmbInt64()
 
         try:
-            call_vimba_c('VmbFeatureIntRangeQuery', self._handle, self._info.name, byref(c_min),
+            call_vimba_c('VmbFeatureIntRangeQuery', self._handle, self._name, byref(c_min),
                          byref(c_max))
 
         except VimbaCError as e:
@@ -878,10 +920,10 @@ class IntFeature(_BaseFeature):
         Raises:
             VimbaFeatureError if access rights are not sufficient.
         """
-        c_val = VmbInt64()
+        c_val = _get_scratch_value(VmbInt64)
 
         try:
-            call_vimba_c('VmbFeatureIntIncrementQuery', self._handle, self._info.name, byref(c_val))
+            call_vimba_c('VmbFeatureIntIncrementQuery', self._handle, self._name, byref(c_val))
 
         except VimbaCError as e:
             if e.get_error_code() == VmbError.InvalidAccess:
@@ -909,7 +951,7 @@ class IntFeature(_BaseFeature):
         as_int = int(val)
 
         try:
-            call_vimba_c('VmbFeatureIntSet', self._handle, self._info.name, as_int)
+            call_vimba_c('VmbFeatureIntSet', self._handle, self._name, as_int)
 
         except VimbaCError as e:
             err = e.get_error_code()
@@ -975,10 +1017,10 @@ class RawFeature(_BaseFeature):
         # Note: Coverage is skipped. RawFeature is not testable in a generic way
         c_buf_avail = VmbUint32()
         c_buf_len = self.length()
-        c_buf = create_string_buffer(c_buf_len)
+        c_buf = _get_scratch_buffer(c_buf_len)
 
         try:
-            call_vimba_c('VmbFeatureRawGet', self._handle, self._info.name, c_buf, c_buf_len,
+            call_vimba_c('VmbFeatureRawGet', self._handle, self._name, c_buf, c_buf_len,
                          byref(c_buf_avail))
 
         except VimbaCError as e:
@@ -990,7 +1032,8 @@ class RawFeature(_BaseFeature):
 
             raise exc from e
 
-        return c_buf.raw[:c_buf_avail.value]
+        # Copy only the bytes written, not the entire buffer.
+        return ctypes.string_at(c_buf, c_buf_avail.value)
 
     @TraceEnable()
     def set(self, buf: bytes):  # coverage: skip
@@ -1007,7 +1050,7 @@ class RawFeature(_BaseFeature):
         as_bytes = bytes(buf)
 
         try:
-            call_vimba_c('VmbFeatureRawSet', self._handle, self._info.name, as_bytes, len(as_bytes))
+            call_vimba_c('VmbFeatureRawSet', self._handle, self._name, as_bytes, len(as_bytes))
 
         except VimbaCError as e:
             err = e.get_error_code()
@@ -1034,10 +1077,10 @@ class RawFeature(_BaseFeature):
             VimbaFeatureError if access rights are not sufficient.
         """
         # Note: Coverage is skipped. RawFeature is not testable in a generic way
-        c_val = VmbUint32()
+        c_val = _get_scratch_value(VmbUint32)
 
         try:
-            call_vimba_c('VmbFeatureRawLengthQuery', self._handle, self._info.name,
+            call_vimba_c('VmbFeatureRawLengthQuery', self._handle, self._name,
                          byref(c_val))
 
         except VimbaCError as e:
@@ -1082,7 +1125,7 @@ class StringFeature(_BaseFeature):
 
         # Query buffer length
         try:
-            call_vimba_c('VmbFeatureStringGet', self._handle, self._info.name, None, 0,
+            call_vimba_c('VmbFeatureStringGet', self._handle, self._name, None, 0,
                          byref(c_buf_len))
 
         except VimbaCError as e:
@@ -1094,11 +1137,11 @@ class StringFeature(_BaseFeature):
 
             raise exc from e
 
-        c_buf = create_string_buffer(c_buf_len.value)
+        c_buf = _get_scratch_buffer(c_buf_len.value)
 
         # Copy string from C-Layer
         try:
-            call_vimba_c('VmbFeatureStringGet', self._handle, self._info.name, c_buf, c_buf_len,
+            call_vimba_c('VmbFeatureStringGet', self._handle, self._name, c_buf, c_buf_len,
                          None)
 
         except VimbaCError as e:
@@ -1127,7 +1170,7 @@ class StringFeature(_BaseFeature):
         as_str = str(val)
 
         try:
-            call_vimba_c('VmbFeatureStringSet', self._handle, self._info.name,
+            call_vimba_c('VmbFeatureStringSet', self._handle, self._name,
                          as_str.encode('utf8'))
 
         except VimbaCError as e:
@@ -1164,7 +1207,7 @@ class StringFeature(_BaseFeature):
         c_max_len = VmbUint32(0)
 
         try:
-            call_vimba_c('VmbFeatureStringMaxlengthQuery', self._handle, self._info.name,
+            call_vimba_c('VmbFeatureStringMaxlengthQuery', self._handle, self._name,
                          byref(c_max_len))
 
         except VimbaCError as e:
@@ -1198,31 +1241,19 @@ FeatureTypeTypes = Union[Type[IntFeature], Type[FloatFeature], Type[StringFeatur
 FeaturesTuple = Tuple[FeatureTypes, ...]
 
 
-def _build_feature(handle: VmbHandle, info: VmbFeatureInfo) -> FeatureTypes:
-    feat_value = VmbFeatureData(info.featureDataType)
-
-    if VmbFeatureData.Int == feat_value:
-        feat = IntFeature(handle, info)
-
-    elif VmbFeatureData.Float == feat_value:
-        feat = FloatFeature(handle, info)
-
-    elif VmbFeatureData.String == feat_value:
-        feat = StringFeature(handle, info)
-
-    elif VmbFeatureData.Bool == feat_value:
-        feat = BoolFeature(handle, info)
+# Feature class lookup by VmbFeatureData value. Unknown or raw data types map to RawFeature.
+_FEATURE_TYPES: Dict[int, FeatureTypeTypes] = {
+    VmbFeatureData.Int: IntFeature,
+    VmbFeatureData.Float: FloatFeature,
+    VmbFeatureData.String: StringFeature,
+    VmbFeatureData.Bool: BoolFeature,
+    VmbFeatureData.Enum: EnumFeature,
+    VmbFeatureData.Command: CommandFeature
+}
 
-    elif VmbFeatureData.Enum == feat_value:
-        feat = EnumFeature(handle, info)
 
-    elif VmbFeatureData.Command == feat_value:
-        feat = CommandFeature(handle, info)
-
-    else:
-        feat = RawFeature(handle, info)
-
-    return feat
+def _build_feature(handle: VmbHandle, info: VmbFeatureInfo) -> FeatureTypes:
+    return _FEATURE_TYPES.get(info.featureDataType, RawFeature)(handle, info)
 
 
 @TraceEnable()
@@ -1235,23 +1266,23 @@ def discover_features(handle: VmbHandle) -> FeaturesTuple:
     Returns:
         A set of all discovered Features associated with handle.
     """
-    result = []
-
     feats_count = VmbUint32(0)
 
-    call_vimba_c('VmbFeaturesList', handle, None, 0, byref(feats_count), sizeof(VmbFeatureInfo))
+    call_vimba_c('VmbFeaturesList', handle, None, 0, byref(feats_count),
+                 SIZEOF_VMB_FEATURE_INFO)
 
-    if feats_count:
-        feats_found = VmbUint32(0)
-        feats_infos = (VmbFeatureInfo * feats_count.value)()
+    if not feats_count:
+        return ()
 
-        call_vimba_c('VmbFeaturesList', handle, feats_infos, feats_count, byref(feats_found),
-                     sizeof(VmbFeatureInfo))
+    # All feature infos are fetched by a single VmbFeaturesList call. No per-feature
+    # VmbFeatureInfoQuery is required during discovery.
+    feats_found = VmbUint32(0)
+    feats_infos = (VmbFeatureInfo * feats_count.value)()
 
-        for info in feats_infos[:feats_found.value]:
-            result.append(_build_feature(handle, info))
+    call_vimba_c('VmbFeaturesList', handle, feats_infos, feats_count, byref(feats_found),
+                 SIZEOF_VMB_FEATURE_INFO)
 
-    return tuple(result)
+    return tuple(_build_feature(handle, info) for info in feats_infos[:feats_found.value])
 
 
 @TraceEnable()
@@ -1268,6 +1299,6 @@ def discover_feature(handle: VmbHandle, feat_name: str) -> FeatureTypes:
     info = VmbFeatureInfo()
 
     call_vimba_c('VmbFeatureInfoQuery', handle, feat_name.encode('utf-8'), byref(info),
-                 sizeof(VmbFeatureInfo))
+                 SIZEOF_VMB_FEATURE_INFO)
 
     return _build_feature(handle, info)
@@ -27,14 +27,14 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import enum
 import ctypes
-import copy
 import functools
 
-from typing import Optional, Tuple
-from .c_binding import byref, sizeof, decode_flags
+from ctypes import byref, sizeof
+from typing import Optional, Tuple, Dict, cast
 from .c_binding import call_vimba_c, call_vimba_image_transform, VmbFrameStatus, VmbFrameFlags, \
                        VmbFrame, VmbHandle, VmbPixelFormat, VmbImage, VmbDebayerMode, \
-                       VmbTransformInfo, PIXEL_FORMAT_CONVERTIBILITY_MAP, PIXEL_FORMAT_TO_LAYOUT
+                       VmbTransformInfo, PIXEL_FORMAT_TO_LAYOUT, PIXEL_FORMAT_TO_CHANNELS, \
+                       query_convertible_formats
 from .feature import FeaturesTuple, FeatureTypes, FeatureTypeTypes, discover_features
 from .shared import filter_features_by_name, filter_features_by_type, filter_features_by_category, \
                     attach_feature_accessors, remove_feature_accessors
@@ -264,8 +264,9 @@ class PixelFormat(enum.IntEnum):
         return 'PixelFormat.{}'.format(str(self))
 
     def get_convertible_formats(self) -> Tuple['PixelFormat', ...]:
-        formats = PIXEL_FORMAT_CONVERTIBILITY_MAP[VmbPixelFormat(self)]
-        return tuple([PixelFormat(fmt) for fmt in formats])
+        # Only the requested format is queried, the query is cached per format. Loads
+        # VimbaImageTransform on first use.
+        return tuple([PixelFormat(fmt) for fmt in query_convertible_formats(self)])
 
 
 MONO_PIXEL_FORMATS = (
@@ -378,6 +379,23 @@ OPENCV_PIXEL_FORMATS = (
 )
 
 
+# Sets for membership tests on each converted frame. PixelFormat hashes like its int value,
+# raw VmbFrame.pixelFormat values can be looked up directly.
+_BAYER_PIXEL_FORMAT_SET = frozenset(BAYER_PIXEL_FORMATS)
+_OPENCV_PIXEL_FORMAT_SET = frozenset(OPENCV_PIXEL_FORMATS)
+
+# Conversions only reordering the channels of 8 bit pixels. The result is exact, the channels
+# are reordered with numpy (if installed) instead of a VimbaImageTransform round-trip.
+# Conversions involving interpolation or color processing (debayering, gamma, color correction)
+# are always left to VimbaImageTransform, results must not depend on the installed packages.
+_CHANNEL_ORDERS: Dict[Tuple[PixelFormat, PixelFormat], Tuple[int, ...]] = {
+    (PixelFormat.Rgb8, PixelFormat.Bgr8): (2, 1, 0),
+    (PixelFormat.Bgr8, PixelFormat.Rgb8): (2, 1, 0),
+    (PixelFormat.Rgba8, PixelFormat.Bgra8): (2, 1, 0, 3),
+    (PixelFormat.Bgra8, PixelFormat.Rgba8): (2, 1, 0, 3)
+}
+
+
 class Debayer(enum.IntEnum):
     """Enum specifying debayer modes.
 
@@ -584,29 +602,60 @@ def _replace_invalid_feature_calls(feats: FeaturesTuple) -> FeaturesTuple:
     return feats
 
 
+# Frame buffers are aligned to memory pages. Transport Layers can transfer image data directly
+# into page aligned buffers instead of staging it in an internal buffer first.
+_BUFFER_ALIGNMENT = 4096
+
+
+def _allocate_aligned_buffer(size: int, alignment: int = _BUFFER_ALIGNMENT) -> ctypes.Array:
+    # ctypes only guarantees malloc alignment. Allocate additional space and return an aligned
+    # view into it, the view keeps the underlying allocation alive.
+    raw = (ctypes.c_ubyte * (size + alignment - 1))()
+    offset = -ctypes.addressof(raw) % alignment
+
+    return (ctypes.c_ubyte * size).from_buffer(raw, offset)
+
+
+def _allocate_frames(buffer_size: int, count: int,
+                     allocation_mode: AllocationMode) -> Tuple['Frame', ...]:
+    # Frames allocated by VimbaPython share a single allocation. Each buffer starts at a page
+    # boundary within it, the pool is kept alive by the views of all frames.
+    if allocation_mode != AllocationMode.AnnounceFrame:
+        return tuple([Frame(buffer_size, allocation_mode) for _ in range(count)])
+
+    stride = -(-buffer_size // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
+    pool = _allocate_aligned_buffer(stride * count)
+
+    return tuple([
+        Frame(buffer_size, allocation_mode,
+              (ctypes.c_ubyte * buffer_size).from_buffer(pool, i * stride))
+        for i in range(count)
+    ])
+
+
 class Frame:
     """This class allows access to Frames acquired by a camera. The Frame is basically
     a buffer that wraps image data and some metadata.
     """
-    def __init__(self, buffer_size: int, allocation_mode: AllocationMode):
+    def __init__(self, buffer_size: int, allocation_mode: AllocationMode,
+                 buffer: Optional[ctypes.Array] = None):
         """Do not call directly. Create Frames via Camera methods instead."""
         self._allocation_mode = allocation_mode
+        self._ndarray_cache: Optional[Tuple] = None
 
         # Allocation is not necessary for the AllocAndAnnounce case. In that case the Transport
         # Layer will take care of buffer allocation. The self._buffer variable will be updated after
         # the frame is announced and memory has been allocated.
+        # The underlaying Frame is set up by the Structure constructor in a single call instead of
+        # assigning each field afterwards.
         if self._allocation_mode == AllocationMode.AnnounceFrame:
-            self._buffer = (ctypes.c_ubyte * buffer_size)()
-        self._frame: VmbFrame = VmbFrame()
+            self._buffer = _allocate_aligned_buffer(buffer_size) if buffer is None else buffer
+            self._frame: VmbFrame = VmbFrame(buffer=ctypes.addressof(self._buffer),
+                                             bufferSize=buffer_size)
 
-        # Setup underlaying Frame
-        if self._allocation_mode == AllocationMode.AnnounceFrame:
-            self._frame.buffer = ctypes.cast(self._buffer, ctypes.c_void_p)
-            self._frame.bufferSize = sizeof(self._buffer)
-        elif self._allocation_mode == AllocationMode.AllocAndAnnounceFrame:
-            # Set buffer pointer to NULL and inform Transport Layer of size it should allocate
-            self._frame.buffer = None
-            self._frame.bufferSize = buffer_size
+        else:
+            # Leave buffer pointer NULL and inform Transport Layer of size it should allocate
+            self._frame = VmbFrame(bufferSize=buffer_size)
 
     def __str__(self):
         msg = 'Frame(id={}, status={}, buffer={})'
@@ -618,11 +667,16 @@ class Frame:
         result = cls.__new__(cls)
         memo[id(self)] = result
 
+        setattr(result, '_ndarray_cache', None)
+
         # VmbFrame contains Pointers and ctypes.Structure with Pointers can't be copied.
         # As a workaround VmbFrame contains a deepcopy-like Method performing deep copy of all
         # Attributes except PointerTypes. Those must be set manually after the copy operation.
-        setattr(result, '_buffer', copy.deepcopy(self._buffer, memo))
+        # The image data is copied by a single memmove instead of copying the ctypes array
+        # element-wise.
+        setattr(result, '_buffer', _allocate_aligned_buffer(self._frame.bufferSize))
         setattr(result, '_frame', self._frame.deepcopy_skip_ptr(memo))
+        self._frame.copy_into(result._buffer)
 
         result._frame.buffer = ctypes.cast(result._buffer, ctypes.c_void_p)
         result._frame.bufferSize = sizeof(result._buffer)
@@ -636,6 +690,7 @@ class Frame:
         """
         self._buffer = ctypes.cast(buffer,
                                    ctypes.POINTER(ctypes.c_ubyte * self._frame.bufferSize)).contents
+        self._ndarray_cache = None
 
     def get_buffer(self) -> ctypes.Array:
         """Get internal buffer object containing image data."""
@@ -679,9 +734,7 @@ class Frame:
             Image height in pixels if dimension data is provided by the camera.
             None if dimension data is not provided by the camera.
         """
-        flags = decode_flags(VmbFrameFlags, self._frame.receiveFlags)
-
-        if VmbFrameFlags.Dimension not in flags:
+        if not self._frame.receiveFlags & VmbFrameFlags.Dimension:
             return None
 
         return self._frame.height
@@ -693,9 +746,7 @@ class Frame:
             Image width in pixels if dimension data is provided by the camera.
             None if dimension data is not provided by the camera.
         """
-        flags = decode_flags(VmbFrameFlags, self._frame.receiveFlags)
-
-        if VmbFrameFlags.Dimension not in flags:
+        if not self._frame.receiveFlags & VmbFrameFlags.Dimension:
             return None
 
         return self._frame.width
@@ -707,9 +758,7 @@ class Frame:
             Horizontal offset in pixel if offset data is provided by the camera.
             None if offset data is not provided by the camera.
         """
-        flags = decode_flags(VmbFrameFlags, self._frame.receiveFlags)
-
-        if VmbFrameFlags.Offset not in flags:
+        if not self._frame.receiveFlags & VmbFrameFlags.Offset:
             return None
 
         return self._frame.offsetX
@@ -721,9 +770,7 @@ class Frame:
             Vertical offset in pixels if offset data is provided by the camera.
             None if offset data is not provided by the camera.
         """
-        flags = decode_flags(VmbFrameFlags, self._frame.receiveFlags)
-
-        if VmbFrameFlags.Offset not in flags:
+        if not self._frame.receiveFlags & VmbFrameFlags.Offset:
             return None
 
         return self._frame.offsetY
@@ -735,9 +782,7 @@ class Frame:
             Frame ID if the id is provided by the camera.
             None if frame id is not provided by the camera.
         """
-        flags = decode_flags(VmbFrameFlags, self._frame.receiveFlags)
-
-        if VmbFrameFlags.FrameID not in flags:
+        if not self._frame.receiveFlags & VmbFrameFlags.FrameID:
             return None
 
         return self._frame.frameID
@@ -749,9 +794,7 @@ class Frame:
             Timestamp if provided by the camera.
             None if timestamp is not provided by the camera.
         """
-        flags = decode_flags(VmbFrameFlags, self._frame.receiveFlags)
-
-        if VmbFrameFlags.Timestamp not in flags:
+        if not self._frame.receiveFlags & VmbFrameFlags.Timestamp:
             return None
 
         return self._frame.timestamp
@@ -780,21 +823,60 @@ class Frame:
             AssertionError if image width or height can't be determined.
         """
 
-        global BAYER_PIXEL_FORMATS
-
         # 1) Perform sanity checking
         fmt = self.get_pixel_format()
 
         if fmt == target_fmt:
             return
 
-        if target_fmt not in fmt.get_convertible_formats():
+        # Channel swaps are convertible by definition. Checked first, they don't need
+        # VimbaImageTransform to be loaded.
+        channel_order = _CHANNEL_ORDERS.get((fmt, target_fmt)) if numpy is not None else None
+
+        if (channel_order is None) and (target_fmt not in fmt.get_convertible_formats()):
             raise ValueError('Current PixelFormat can\'t be converted into given format.')
 
-        # 2) Specify Transformation Input Image
+        height = self._frame.height
+        width = self._frame.width
+        anc_size = self._frame.ancillarySize
+
+        if channel_order is not None:
+            img_size = height * width * len(channel_order)
+            buf = (ctypes.c_ubyte * (img_size + anc_size))()
+
+            src = numpy.frombuffer(self._buffer, dtype=numpy.uint8, count=img_size)  # type: ignore
+            dst = numpy.frombuffer(buf, dtype=numpy.uint8, count=img_size)
+
+            # mode='clip' writes into 'out' directly, the indices are valid by construction.
+            numpy.take(src.reshape(height, width, len(channel_order)), channel_order, axis=2,
+                       out=dst.reshape(height, width, len(channel_order)), mode='clip')
+
+        else:
+            img_size, buf = self._transform_pixel_format(fmt, target_fmt, debayer_mode)
+
+        # Copy ancillary data if existing
+        if anc_size:
+            src = ctypes.addressof(self._buffer) + self._frame.imageSize
+            dst = ctypes.addressof(buf) + img_size
+
+            ctypes.memmove(dst, src, anc_size)
+
+        # Update frame metadata
+        self._buffer = buf
+        self._ndarray_cache = None
+        self._frame.buffer = ctypes.cast(self._buffer, ctypes.c_void_p)
+        self._frame.bufferSize = sizeof(self._buffer)
+        self._frame.imageSize = img_size
+        self._frame.pixelFormat = target_fmt
+
+    def _transform_pixel_format(self, fmt: PixelFormat, target_fmt: PixelFormat,
+                                debayer_mode: Optional[Debayer]):
+        # Converts the image via VimbaImageTransform into a newly allocated buffer with room
+        # for ancillary data. Returns the image size and the buffer.
         height = self._frame.height
         width = self._frame.width
 
+        # 1) Specify Transformation Input Image
         c_src_image = VmbImage()
         c_src_image.Size = sizeof(c_src_image)
         c_src_image.Data = ctypes.cast(self._buffer, ctypes.c_void_p)
@@ -802,45 +884,34 @@ class Frame:
         call_vimba_image_transform('VmbSetImageInfoFromPixelFormat', fmt, width, height,
                                    byref(c_src_image))
 
-        # 3) Specify Transformation Output Image
+        # 2) Specify Transformation Output Image
         c_dst_image = VmbImage()
         c_dst_image.Size = sizeof(c_dst_image)
 
-        layout, bits = PIXEL_FORMAT_TO_LAYOUT[VmbPixelFormat(target_fmt)]
+        # PixelFormat and VmbPixelFormat share values and hashes, no conversion needed for lookup.
+        layout, bits = PIXEL_FORMAT_TO_LAYOUT[cast(VmbPixelFormat, target_fmt)]
 
         call_vimba_image_transform('VmbSetImageInfoFromInputImage', byref(c_src_image), layout,
                                    bits, byref(c_dst_image))
 
-        # 4) Allocate Buffer and perform transformation
+        # 3) Allocate Buffer and perform transformation
         img_size = int(height * width * c_dst_image.ImageInfo.PixelInfo.BitsPerPixel / 8)
         anc_size = self._frame.ancillarySize
 
         buf = (ctypes.c_ubyte * (img_size + anc_size))()
         c_dst_image.Data = ctypes.cast(buf, ctypes.c_void_p)
 
-        # 5) Setup Debayering mode if given.
+        # 4) Setup Debayering mode if given.
         transform_info = VmbTransformInfo()
-        if debayer_mode and (fmt in BAYER_PIXEL_FORMATS):
+        if debayer_mode and (fmt in _BAYER_PIXEL_FORMAT_SET):
             call_vimba_image_transform('VmbSetDebayerMode', VmbDebayerMode(debayer_mode),
                                        byref(transform_info))
 
-        # 6) Perform Transformation
+        # 5) Perform Transformation
         call_vimba_image_transform('VmbImageTransform', byref(c_src_image), byref(c_dst_image),
                                    byref(transform_info), 1)
 
-        # 7) Copy ancillary data if existing
-        if anc_size:
-            src = ctypes.addressof(self._buffer) + self._frame.imageSize
-            dst = ctypes.addressof(buf) + img_size
-
-            ctypes.memmove(dst, src, anc_size)
-
-        # 8) Update frame metadata
-        self._buffer = buf
-        self._frame.buffer = ctypes.cast(self._buffer, ctypes.c_void_p)
-        self._frame.bufferSize = sizeof(self._buffer)
-        self._frame.imageSize = img_size
-        self._frame.pixelFormat = target_fmt
+        return img_size, buf
 
     def as_numpy_ndarray(self) -> 'numpy.ndarray':
         """Construct numpy.ndarray view on VimbaFrame.
@@ -860,11 +931,13 @@ class Frame:
         width = self._frame.width
         fmt = self._frame.pixelFormat
 
-        c_image = VmbImage()
-        c_image.Size = sizeof(c_image)
+        # Streaming reuses frames for every image, usually without changing format or size.
+        # The view is kept until the buffer, format or dimensions change.
+        key = (fmt, width, height)
+        cached = self._ndarray_cache
 
-        call_vimba_image_transform('VmbSetImageInfoFromPixelFormat', fmt, width, height,
-                                   byref(c_image))
+        if cached is not None and cached[0] is self._buffer and cached[1] == key:
+            return cached[2]
 
         layout = PIXEL_FORMAT_TO_LAYOUT.get(fmt)
 
@@ -874,11 +947,14 @@ class Frame:
             raise VimbaFrameError(msg.format(str(self.get_pixel_format())))
 
         bits_per_channel = layout[1]
-        channels_per_pixel = c_image.ImageInfo.PixelInfo.BitsPerPixel // bits_per_channel
+        channels_per_pixel = PIXEL_FORMAT_TO_CHANNELS[fmt]
+
+        arr = numpy.ndarray(shape=(height, width, channels_per_pixel),
+                            buffer=self._buffer,  # type: ignore
+                            dtype=numpy.uint8 if bits_per_channel == 8 else numpy.uint16)
 
-        return numpy.ndarray(shape=(height, width, channels_per_pixel),
-                             buffer=self._buffer,  # type: ignore
-                             dtype=numpy.uint8 if bits_per_channel == 8 else numpy.uint16)
+        self._ndarray_cache = (self._buffer, key, arr)
+        return arr
 
     def as_opencv_image(self) -> 'numpy.ndarray':
         """Construct OpenCV compatible view on VimbaFrame.
@@ -891,16 +967,14 @@ class Frame:
             ValueError if current pixel format is not compatible with opencv. Compatible
                        formats are in OPENCV_PIXEL_FORMATS.
         """
-        global OPENCV_PIXEL_FORMATS
-
         if numpy is None:
             raise ImportError('\'Frame.as_opencv_image()\' requires module \'numpy\'.')
 
         fmt = self._frame.pixelFormat
 
-        if fmt not in OPENCV_PIXEL_FORMATS:
+        if fmt not in _OPENCV_PIXEL_FORMAT_SET:
             raise ValueError('Current Format \'{}\' is not in OPENCV_PIXEL_FORMATS'.format(
-                             str(PixelFormat(self._frame.pixelFormat))))
+                             str(PixelFormat(fmt))))
 
         return self.as_numpy_ndarray()
 
@@ -920,4 +994,4 @@ def intersect_pixel_formats(fmts1: FormatTuple, fmts2: FormatTuple) -> FormatTup
     Raises:
             TypeError if parameters do not match their type hint.
     """
-    return tuple(set(fmts1).intersection(set(fmts2)))
+    return tuple(set(fmts1).intersection(fmts2))
@@ -26,8 +26,9 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import enum
+from ctypes import byref, sizeof
 from typing import Tuple, List, Callable, Dict
-from .c_binding import call_vimba_c, byref, sizeof, decode_cstr
+from .c_binding import call_vimba_c, decode_cstr
 from .c_binding import VmbInterface, VmbInterfaceInfo, VmbHandle, VmbUint32
 from .feature import discover_features, FeatureTypes, FeaturesTuple, FeatureTypeTypes
 from .shared import filter_features_by_name, filter_features_by_type, filter_affected_features, \
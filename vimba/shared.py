@@ -25,11 +25,10 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
-import itertools
-
+from ctypes import byref, create_string_buffer
 from typing import Dict, Tuple
 from .c_binding import VmbUint32, VmbUint64, VmbHandle, VmbFeatureInfo
-from .c_binding import call_vimba_c, byref, sizeof, create_string_buffer, VimbaCError
+from .c_binding import call_vimba_c, VimbaCError, SIZEOF_VMB_FEATURE_INFO
 from .feature import FeaturesTuple, FeatureTypes, FeatureTypeTypes
 from .error import VimbaFeatureError
 from .util import TraceEnable
@@ -72,22 +71,22 @@ def filter_affected_features(feats: FeaturesTuple, feat: FeatureTypes) -> Featur
     if feat.has_affected_features():
         feats_count = VmbUint32()
         feats_handle = feat._handle
-        feats_name = feat._info.name
+        feats_name = feat._name
 
         # Query affected features from given Feature
         call_vimba_c('VmbFeatureListAffected', feats_handle, feats_name, None, 0,
-                     byref(feats_count), sizeof(VmbFeatureInfo))
+                     byref(feats_count), SIZEOF_VMB_FEATURE_INFO)
 
         feats_found = VmbUint32(0)
         feats_infos = (VmbFeatureInfo * feats_count.value)()
 
         call_vimba_c('VmbFeatureListAffected', feats_handle, feats_name, feats_infos, feats_count,
-                     byref(feats_found), sizeof(VmbFeatureInfo))
+                     byref(feats_found), SIZEOF_VMB_FEATURE_INFO)
 
         # Search affected features in given feature set
-        for info, feature in itertools.product(feats_infos[:feats_found.value], feats):
-            if info.name == feature._info.name:
-                result.append(feature)
+        for info in feats_infos[:feats_found.value]:
+            name = info.name
+            result.extend([feature for feature in feats if feature._name == name])
 
     return tuple(result)
 
@@ -114,22 +113,22 @@ def filter_selected_features(feats: FeaturesTuple, feat: FeatureTypes) -> Featur
     if feat.has_selected_features():
         feats_count = VmbUint32()
         feats_handle = feat._handle
-        feats_name = feat._info.name
+        feats_name = feat._name
 
         # Query selected features from given feature
         call_vimba_c('VmbFeatureListSelected', feats_handle, feats_name, None, 0,
-                     byref(feats_count), sizeof(VmbFeatureInfo))
+                     byref(feats_count), SIZEOF_VMB_FEATURE_INFO)
 
         feats_found = VmbUint32(0)
         feats_infos = (VmbFeatureInfo * feats_count.value)()
 
         call_vimba_c('VmbFeatureListSelected', feats_handle, feats_name, feats_infos, feats_count,
-                     byref(feats_found), sizeof(VmbFeatureInfo))
+                     byref(feats_found), SIZEOF_VMB_FEATURE_INFO)
 
         # Search selected features in given feature set
-        for info, feature in itertools.product(feats_infos[:feats_found.value], feats):
-            if info.name == feature._info.name:
-                result.append(feature)
+        for info in feats_infos[:feats_found.value]:
+            name = info.name
+            result.extend([feature for feature in feats if feature._name == name])
 
     return tuple(result)
 
@@ -145,7 +144,11 @@ def filter_features_by_name(feats: FeaturesTuple, feat_name: str):
     Returns:
         The Feature with the name 'feat_name' or None if lookup failed
     """
-    filtered = [feat for feat in feats if feat_name == feat.get_name()]
+    # Compare against the undecoded names stored in each feature instead of decoding the name
+    # of every feature in the set.
+    name = feat_name.encode('utf-8')
+
+    filtered = [feat for feat in feats if feat._name == name]
     return filtered.pop() if filtered else None
 
 
@@ -58,15 +58,21 @@ __all__ = [
     'RaiseIfOutsideContext'
 ]
 
-from .log import Log, LogLevel, LogConfig, LOG_CONFIG_TRACE_CONSOLE_ONLY, \
-                 LOG_CONFIG_TRACE_FILE_ONLY, LOG_CONFIG_TRACE, LOG_CONFIG_INFO_CONSOLE_ONLY, \
-                 LOG_CONFIG_INFO_FILE_ONLY, LOG_CONFIG_INFO, LOG_CONFIG_WARNING_CONSOLE_ONLY, \
-                 LOG_CONFIG_WARNING_FILE_ONLY, LOG_CONFIG_WARNING, LOG_CONFIG_ERROR_CONSOLE_ONLY, \
-                 LOG_CONFIG_ERROR_FILE_ONLY, LOG_CONFIG_ERROR, LOG_CONFIG_CRITICAL_CONSOLE_ONLY, \
-                 LOG_CONFIG_CRITICAL_FILE_ONLY, LOG_CONFIG_CRITICAL
+from .log import Log, LogLevel, LogConfig
+from . import log as _log
 
 from .tracer import TraceEnable
 from .scoped_log import ScopedLogEnable
 from .runtime_type_check import RuntimeTypeCheckEnable
 from .context_decorator import EnterContextOnCall, LeaveContextOnCall, RaiseIfInsideContext, \
                                RaiseIfOutsideContext
+
+
+def __getattr__(name: str):
+    # Default log configurations are built by the log module on first access.
+    if name in _log._LOG_CONFIG_LEVELS:
+        value = getattr(_log, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError('module {} has no attribute {}'.format(__name__, name))
@@ -277,19 +277,50 @@ def _build_cfg(console_level: Optional[LogLevel], file_level: Optional[LogLevel]
     return cfg
 
 
-# Exported Default Log configurations.
-LOG_CONFIG_TRACE_CONSOLE_ONLY = _build_cfg(LogLevel.Trace, None)
-LOG_CONFIG_TRACE_FILE_ONLY = _build_cfg(None, LogLevel.Trace)
-LOG_CONFIG_TRACE = _build_cfg(LogLevel.Trace, LogLevel.Trace)
-LOG_CONFIG_INFO_CONSOLE_ONLY = _build_cfg(LogLevel.Info, None)
-LOG_CONFIG_INFO_FILE_ONLY = _build_cfg(None, LogLevel.Info)
-LOG_CONFIG_INFO = _build_cfg(LogLevel.Info, LogLevel.Info)
-LOG_CONFIG_WARNING_CONSOLE_ONLY = _build_cfg(LogLevel.Warning, None)
-LOG_CONFIG_WARNING_FILE_ONLY = _build_cfg(None, LogLevel.Warning)
-LOG_CONFIG_WARNING = _build_cfg(LogLevel.Warning, LogLevel.Warning)
-LOG_CONFIG_ERROR_CONSOLE_ONLY = _build_cfg(LogLevel.Error, None)
-LOG_CONFIG_ERROR_FILE_ONLY = _build_cfg(None, LogLevel.Error)
-LOG_CONFIG_ERROR = _build_cfg(LogLevel.Error, LogLevel.Error)
-LOG_CONFIG_CRITICAL_CONSOLE_ONLY = _build_cfg(LogLevel.Critical, None)
-LOG_CONFIG_CRITICAL_FILE_ONLY = _build_cfg(None, LogLevel.Critical)
-LOG_CONFIG_CRITICAL = _build_cfg(LogLevel.Critical, LogLevel.Critical)
+# Exported Default Log configurations. Each configuration is built on first access and cached
+# within the module namespace, most applications use at most one of them.
+LOG_CONFIG_TRACE_CONSOLE_ONLY: LogConfig
+LOG_CONFIG_TRACE_FILE_ONLY: LogConfig
+LOG_CONFIG_TRACE: LogConfig
+LOG_CONFIG_INFO_CONSOLE_ONLY: LogConfig
+LOG_CONFIG_INFO_FILE_ONLY: LogConfig
+LOG_CONFIG_INFO: LogConfig
+LOG_CONFIG_WARNING_CONSOLE_ONLY: LogConfig
+LOG_CONFIG_WARNING_FILE_ONLY: LogConfig
+LOG_CONFIG_WARNING: LogConfig
+LOG_CONFIG_ERROR_CONSOLE_ONLY: LogConfig
+LOG_CONFIG_ERROR_FILE_ONLY: LogConfig
+LOG_CONFIG_ERROR: LogConfig
+LOG_CONFIG_CRITICAL_CONSOLE_ONLY: LogConfig
+LOG_CONFIG_CRITICAL_FILE_ONLY: LogConfig
+LOG_CONFIG_CRITICAL: LogConfig
+
+_LOG_CONFIG_LEVELS = {
+    'LOG_CONFIG_TRACE_CONSOLE_ONLY': (LogLevel.Trace, None),
+    'LOG_CONFIG_TRACE_FILE_ONLY': (None, LogLevel.Trace),
+    'LOG_CONFIG_TRACE': (LogLevel.Trace, LogLevel.Trace),
+    'LOG_CONFIG_INFO_CONSOLE_ONLY': (LogLevel.Info, None),
+    'LOG_CONFIG_INFO_FILE_ONLY': (None, LogLevel.Info),
+    'LOG_CONFIG_INFO': (LogLevel.Info, LogLevel.Info),
+    'LOG_CONFIG_WARNING_CONSOLE_ONLY': (LogLevel.Warning, None),
+    'LOG_CONFIG_WARNING_FILE_ONLY': (None, LogLevel.Warning),
+    'LOG_CONFIG_WARNING': (LogLevel.Warning, LogLevel.Warning),
+    'LOG_CONFIG_ERROR_CONSOLE_ONLY': (LogLevel.Error, None),
+    'LOG_CONFIG_ERROR_FILE_ONLY': (None, LogLevel.Error),
+    'LOG_CONFIG_ERROR': (LogLevel.Error, LogLevel.Error),
+    'LOG_CONFIG_CRITICAL_CONSOLE_ONLY': (LogLevel.Critical, None),
+    'LOG_CONFIG_CRITICAL_FILE_ONLY': (None, LogLevel.Critical),
+    'LOG_CONFIG_CRITICAL': (LogLevel.Critical, LogLevel.Critical)
+}
+
+
+def __getattr__(name: str):
+    try:
+        console_level, file_level = _LOG_CONFIG_LEVELS[name]
+
+    except KeyError:
+        raise AttributeError('module {} has no attribute {}'.format(__name__, name)) from None
+
+    cfg = _build_cfg(console_level, file_level)
+    globals()[name] = cfg
+    return cfg
@@ -120,8 +120,14 @@ class TraceEnable:
     """Decorator: Adds an entry of LogLevel. Trace on entry and exit of the wrapped function.
     On exit, the log entry contains information if the function was left normally or with an
     exception.
+
+    In optimized runs (python -O) the function is returned unwrapped, saving the additional
+    call frame on every invocation.
     """
     def __call__(self, func):
+        if not __debug__:
+            return func
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             if _Tracer.is_log_enabled():
@@ -27,8 +27,8 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import threading
 from typing import List, Dict, Tuple
-from .c_binding import call_vimba_c, VIMBA_C_VERSION, VIMBA_IMAGE_TRANSFORM_VERSION, \
-                       G_VIMBA_C_HANDLE
+from .c_binding import call_vimba_c, G_VIMBA_C_HANDLE
+from . import c_binding
 from .feature import discover_features, FeatureTypes, FeaturesTuple, FeatureTypeTypes, EnumFeature
 from .shared import filter_features_by_name, filter_features_by_type, filter_affected_features, \
                     filter_selected_features, filter_features_by_category, \
@@ -94,7 +94,8 @@ class Vimba:
         def get_version(self) -> str:
             """ Returns version string of VimbaPython and underlaying dependencies."""
             msg = 'VimbaPython: {} (using VimbaC: {}, VimbaImageTransform: {})'
-            return msg.format(VIMBA_PYTHON_VERSION, VIMBA_C_VERSION, VIMBA_IMAGE_TRANSFORM_VERSION)
+            return msg.format(VIMBA_PYTHON_VERSION, c_binding.VIMBA_C_VERSION,
+                              c_binding.VIMBA_IMAGE_TRANSFORM_VERSION)
 
         @RaiseIfInsideContext()
         @RuntimeTypeCheckEnable()
@@ -477,7 +478,11 @@ class Vimba:
         @TraceEnable()
         @EnterContextOnCall()
         def _startup(self):
-            Log.get_instance().info('Starting {}'.format(self.get_version()))
+            log = Log.get_instance()
+
+            # get_version() loads VimbaImageTransform. Only query it if the message is logged.
+            if log:
+                log.info('Starting {}'.format(self.get_version()))
 
             call_vimba_c('VmbStartup')
 